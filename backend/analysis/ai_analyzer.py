@@ -28,6 +28,21 @@ OPENROUTER_VISION_MODELS = {
 }
 
 
+# Health score phrasings, tried in order: "health: 7", "score: 8/10", "7/10", ...
+_HEALTH_SCORE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'health[:\s]+(?:score)?[:\s]*([0-9]+)(?:/10)?',
+    r'score[:\s]*([0-9]+)(?:/10)?',
+    r'([0-9]+)/10',
+    r'health rating[:\s]*([0-9]+)'
+))
+
+# Recommendations section headings, tried in order
+_RECOMMENDATION_PATTERNS = tuple(re.compile(pattern, re.DOTALL) for pattern in (
+    r'(?:recommendations?|suggestions?)[:\s]*(.+?)(?=\n\n|\Z)',
+    r'(?:5\.\s*)?recommendations?[:\s]*(.+?)(?=\n\n|\Z)',
+))
+
+
 class AIAnalysisError(Exception):
     """Custom exception for AI analysis errors."""
     pass
@@ -119,16 +134,10 @@ Provide a structured response with these sections.
         Returns:
             Health score (1-10) or None if not found
         """
-        # Look for patterns like "health: 7", "score: 8/10", "7/10", etc.
-        patterns = [
-            r'health[:\s]+(?:score)?[:\s]*([0-9]+)(?:/10)?',
-            r'score[:\s]*([0-9]+)(?:/10)?',
-            r'([0-9]+)/10',
-            r'health rating[:\s]*([0-9]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, analysis_text.lower())
+        text = analysis_text.lower()
+        
+        for pattern in _HEALTH_SCORE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 score = int(match.group(1))
                 if 1 <= score <= 10:
@@ -146,13 +155,10 @@ Provide a structured response with these sections.
             Recommendations text
         """
         # Try to find recommendations section
-        patterns = [
-            r'(?:recommendations?|suggestions?)[:\s]*(.+?)(?=\n\n|\Z)',
-            r'(?:5\.\s*)?recommendations?[:\s]*(.+?)(?=\n\n|\Z)',
-        ]
+        text = analysis_text.lower()
         
-        for pattern in patterns:
-            match = re.search(pattern, analysis_text.lower(), re.DOTALL)
+        for pattern in _RECOMMENDATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -1,4 +1,5 @@
 """AI Analysis API endpoints."""
+import asyncio
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 from typing import Optional
@@ -7,7 +8,8 @@ from pathlib import Path
 
 from backend.database import db
 from backend.analysis.ai_analyzer import get_ai_analyzer, AIAnalysisError
-from backend.config import DATA_DIR
+from backend.config import DATA_DIR, ensure_dir
+from backend.utils.files import latest_photo
 
 router = APIRouter(prefix="/api/analysis", tags=["analysis"])
 
@@ -85,10 +87,12 @@ async def analyze_now(background_tasks: BackgroundTasks, request: Optional[Analy
             if _camera:
                 try:
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    photo_dir = DATA_DIR / "photos"
-                    photo_dir.mkdir(parents=True, exist_ok=True)
-                    photo_path = str(photo_dir / f"analysis_{timestamp}.jpg")
-                    _camera.capture_photo(photo_path)
+                    photo_dir = ensure_dir(DATA_DIR / "photos")
+                    # Capture with the engine's shared camera, off the loop
+                    captured = await _camera.capture_image_async(
+                        photo_dir / f"analysis_{timestamp}.jpg"
+                    )
+                    photo_path = str(captured) if captured else None
                 except Exception as e:
                     # Try to use latest existing photo
                     pass
@@ -97,9 +101,7 @@ async def analyze_now(background_tasks: BackgroundTasks, request: Optional[Analy
             if not photo_path or not Path(photo_path).exists():
                 photos_dir = DATA_DIR / "photos"
                 if photos_dir.exists():
-                    photos = sorted(photos_dir.glob("*.jpg"))
-                    if photos:
-                        photo_path = str(photos[-1])
+                    photo_path = latest_photo(photos_dir)
         
         if not photo_path or not Path(photo_path).exists():
             raise HTTPException(status_code=404, detail="No photo available for analysis")
@@ -181,7 +183,7 @@ async def sync_analysis(analysis_id: int):
         if not _sync_module or not _sync_module.enabled:
             raise HTTPException(status_code=400, detail="External sync not enabled")
         
-        result = _sync_module.sync_analysis_report(analysis)
+        result = await asyncio.to_thread(_sync_module.sync_analysis_report, analysis)
         
         if result.get('success'):
             db.mark_analysis_synced(analysis_id)
@@ -208,8 +210,9 @@ async def _run_analysis(photo_path: str, custom_prompt: Optional[str],
             logger.error("AI analyzer not available")
             return
         
-        # Run analysis
-        result = ai_analyzer.analyze_photo(photo_path, custom_prompt)
+        # Run analysis; the HTTP call blocks, and this task shares the
+        # event loop with the Telegram bot and the scheduler
+        result = await asyncio.to_thread(ai_analyzer.analyze_photo, photo_path, custom_prompt)
         
         # Get active project
         project = db.get_active_project()
@@ -234,7 +237,7 @@ async def _run_analysis(photo_path: str, custom_prompt: Optional[str],
                 message = ai_analyzer.format_telegram_message(
                     result, project.get('name', '') if project else ''
                 )
-                _telegram_bot.send_message(message)
+                await _telegram_bot.send_message(message)
                 logger.info("Analysis sent to Telegram")
             except Exception as e:
                 logger.error(f"Failed to send to Telegram: {e}")
@@ -244,7 +247,7 @@ async def _run_analysis(photo_path: str, custom_prompt: Optional[str],
             try:
                 analysis_data = db.get_ai_analysis(analysis_id)
                 if analysis_data:
-                    _sync_module.sync_analysis_report(analysis_data)
+                    await asyncio.to_thread(_sync_module.sync_analysis_report, analysis_data)
                     db.mark_analysis_synced(analysis_id)
                     logger.info("Analysis synced to external server")
             except Exception as e:
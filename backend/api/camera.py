@@ -1,15 +1,31 @@
 """Camera API endpoints."""
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse, FileResponse, Response
 from typing import Optional
 from pathlib import Path
-import io
+import asyncio
+import hashlib
+import logging
+import time
 from datetime import datetime
 
 from backend.config import DATA_DIR
+from backend.utils.files import etag_matches
 
 router = APIRouter(prefix="/api/camera", tags=["camera"])
 
+logger = logging.getLogger(__name__)
+
+# /live serves a frame younger than LIVE_FRAME_MAX_AGE as-is; an older one
+# (up to LIVE_FRAME_STALE_AFTER) is served while a new capture runs in the
+# background, so polls don't wait on the camera
+LIVE_FRAME_MAX_AGE = 2.0
+LIVE_FRAME_STALE_AFTER = 10.0
+
+# Latest live frame and the capture refreshing it
+_live_frame = {"ts": 0.0, "bytes": None, "etag": None}
+_live_refresh: Optional[asyncio.Task] = None
+
 # Global reference to automation engine (set in main.py)
 automation_engine = None
 
@@ -25,8 +41,8 @@ async def capture_snapshot():
         if not automation_engine:
             raise HTTPException(status_code=503, detail="Automation engine not available")
         
-        # Capture image
-        photo_path = automation_engine.capture_photo()
+        # Capture image without holding up the event loop
+        photo_path = await automation_engine.capture_photo_async()
         
         if not photo_path or not Path(photo_path).exists():
             raise HTTPException(status_code=500, detail="Failed to capture image")
@@ -45,7 +61,7 @@ async def capture_snapshot():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/stream")
-async def camera_stream():
+async def camera_stream(fps: int = Query(2, ge=1, le=30, description="Frames per second")):
     """Get camera stream (MJPEG)."""
     try:
         if not automation_engine:
@@ -53,18 +69,12 @@ async def camera_stream():
         
         def generate():
             """Generate MJPEG stream."""
-            while True:
-                try:
-                    # Capture frame
-                    frame_bytes = automation_engine.camera.capture_to_stream()
-                    if frame_bytes:
-                        yield (b'--frame\r\n'
-                               b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-                    else:
-                        break
-                except Exception as e:
-                    print(f"Stream error: {e}")
-                    break
+            try:
+                for frame_bytes in automation_engine.camera.stream_frames(fps):
+                    yield (b'--frame\r\n'
+                           b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+            except Exception as e:
+                logger.error(f"Stream error: {e}")
         
         return StreamingResponse(
             generate(),
@@ -75,23 +85,59 @@ async def camera_stream():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _refresh_live_frame():
+    """Capture a new live frame into _live_frame."""
+    try:
+        # Blocks on the camera worker, so run it off the loop
+        image_bytes = await asyncio.to_thread(automation_engine.camera.capture_to_stream)
+    except Exception as e:
+        logger.error(f"Live frame capture failed: {e}")
+        return
+    
+    if image_bytes:
+        _live_frame.update(
+            ts=time.monotonic(),
+            bytes=image_bytes,
+            etag=f'"{hashlib.blake2b(image_bytes, digest_size=8).hexdigest()}"'
+        )
+
+
+def _start_live_refresh() -> asyncio.Task:
+    """Start a live frame capture unless one is already running."""
+    global _live_refresh
+    if _live_refresh is None or _live_refresh.done():
+        _live_refresh = asyncio.create_task(_refresh_live_frame())
+    return _live_refresh
+
 @router.get("/live")
-async def get_live_image():
-    """Get a single live image from camera."""
+async def get_live_image(request: Request):
+    """Get a single live image from camera.
+    
+    Concurrent polls share one capture, and a slightly old frame is
+    returned immediately while the next one is captured. The frame
+    carries an ETag of its content, so a client revalidating an
+    unchanged frame gets a 304.
+    """
     try:
         if not automation_engine:
             raise HTTPException(status_code=503, detail="Automation engine not available")
         
-        # Capture to bytes
-        image_bytes = automation_engine.camera.capture_to_stream()
+        age = time.monotonic() - _live_frame["ts"]
+        if _live_frame["bytes"] is None or age >= LIVE_FRAME_STALE_AFTER:
+            await asyncio.shield(_start_live_refresh())
+        elif age >= LIVE_FRAME_MAX_AGE:
+            _start_live_refresh()
         
+        image_bytes = _live_frame["bytes"]
         if not image_bytes:
             raise HTTPException(status_code=500, detail="Failed to capture image")
         
-        return StreamingResponse(
-            io.BytesIO(image_bytes),
-            media_type="image/jpeg"
-        )
+        etag = _live_frame["etag"]
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        
+        return Response(image_bytes, media_type="image/jpeg", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
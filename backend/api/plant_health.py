@@ -3,6 +3,7 @@ from fastapi import APIRouter, HTTPException, UploadFile, File
 from pydantic import BaseModel
 from typing import Optional
 from pathlib import Path
+import asyncio
 import base64
 import json
 
@@ -57,7 +58,7 @@ async def analyze_from_camera():
             raise HTTPException(status_code=503, detail="Automation engine not available")
         
         # Capture image
-        photo_path = automation_engine.capture_photo()
+        photo_path = await automation_engine.capture_photo_async()
         
         if not photo_path or not Path(photo_path).exists():
             raise HTTPException(status_code=500, detail="Failed to capture image")
@@ -95,8 +96,8 @@ async def _analyze_image(image_path: Path, image_data: bytes) -> dict:
             print(f"OpenAI analysis failed: {e}")
             # Fall back to simple analysis
     
-    # Simple color-based analysis (fallback)
-    return _simple_color_analysis(image_path)
+    # Simple color-based analysis (fallback), decoded off the event loop
+    return await asyncio.to_thread(_simple_color_analysis, image_path)
 
 async def _analyze_with_openai(image_data: bytes) -> dict:
     """Analyze image using OpenAI Vision API."""
@@ -123,7 +124,9 @@ async def _analyze_with_openai(image_data: bytes) -> dict:
     - Water stress
     """
     
-    response = client.chat.completions.create(
+    # The client is synchronous; keep the request off the event loop
+    response = await asyncio.to_thread(
+        client.chat.completions.create,
         model="gpt-4-vision-preview",
         messages=[
             {
@@ -171,8 +174,10 @@ def _simple_color_analysis(image_path: Path) -> dict:
         from PIL import Image
         import numpy as np
         
-        # Load image
+        # Load image; only the average colour is needed, so let libjpeg
+        # decode at 1/8 scale (DCT scaling) instead of the full 12 MP frame
         img = Image.open(image_path)
+        img.draft('RGB', (max(1, img.width // 8), max(1, img.height // 8)))
         img = img.convert('RGB')
         
         # Get pixels
@@ -286,19 +286,21 @@ async def get_project_statistics(project_id: int):
             raise HTTPException(status_code=404, detail="Project not found")
         
         # Get sensor data statistics
-        sensor_data = db.get_sensor_data(project_id=project_id, limit=10000)
+        sensor_data = db.get_sensor_columns(
+            ('temperature', 'humidity'), project_id=project_id, limit=10000
+        )
         
         stats = {
             "project": project,
             "timelapse_count": db.get_timelapse_image_count(project_id),
-            "sensor_readings": len(sensor_data),
+            "sensor_readings": len(sensor_data['temperature']),
             "diary_entries": len(db.get_diary_entries(project_id)),
             "ai_analyses": len(db.get_ai_analyses(project_id=project_id))
         }
         
-        if sensor_data:
-            temps = [d['temperature'] for d in sensor_data if d.get('temperature')]
-            humidities = [d['humidity'] for d in sensor_data if d.get('humidity')]
+        if sensor_data['temperature']:
+            temps = [t for t in sensor_data['temperature'] if t]
+            humidities = [h for h in sensor_data['humidity'] if h]
             
             if temps:
                 stats['temperature'] = {
@@ -4,6 +4,8 @@ from typing import Optional
 from datetime import datetime, timedelta
 
 from backend.database import db
+from backend.config import SENSOR_READ_INTERVAL
+from backend.hardware.sensor import read_shared_reading
 
 router = APIRouter(prefix="/api/sensors", tags=["sensors"])
 
@@ -11,7 +13,9 @@ router = APIRouter(prefix="/api/sensors", tags=["sensors"])
 async def get_current_sensor_data():
     """Get current/latest sensor readings."""
     try:
-        data = db.get_latest_sensor_data()
+        # Prefer the live reading published by the automation engine; the
+        # database is only written every DATA_LOG_INTERVAL
+        data = read_shared_reading(2 * SENSOR_READ_INTERVAL) or db.get_latest_sensor_data()
         if not data:
             return {"success": True, "data": None, "message": "No sensor data available"}
         return {"success": True, "data": data}
@@ -63,20 +67,22 @@ async def get_sensor_stats(
             if active_project:
                 project_id = active_project['id']
         
-        data = db.get_sensor_data(
+        data = db.get_sensor_columns(
+            ('temperature', 'humidity', 'pressure'),
             project_id=project_id,
             start_date=start_date,
             end_date=end_date,
             limit=10000
         )
         
-        if not data:
+        data_points = len(data['temperature'])
+        if not data_points:
             return {"success": True, "data": None, "message": "No data available"}
         
         # Calculate statistics
-        temps = [d['temperature'] for d in data if d['temperature'] is not None]
-        humidities = [d['humidity'] for d in data if d['humidity'] is not None]
-        pressures = [d['pressure'] for d in data if d['pressure'] is not None]
+        temps = [t for t in data['temperature'] if t is not None]
+        humidities = [h for h in data['humidity'] if h is not None]
+        pressures = [p for p in data['pressure'] if p is not None]
         
         stats = {
             "temperature": {
@@ -95,7 +101,7 @@ async def get_sensor_stats(
                 "avg": sum(pressures) / len(pressures) if pressures else None
             },
             "period_hours": hours,
-            "data_points": len(data)
+            "data_points": data_points
         }
         
         return {"success": True, "data": stats}
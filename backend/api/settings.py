@@ -8,6 +8,14 @@ from backend.config import GPIO_PINS
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
+# Global reference to automation engine (set in main.py)
+automation_engine = None
+
+def set_automation_engine(engine):
+    """Set the automation engine reference."""
+    global automation_engine
+    automation_engine = engine
+
 class DeviceSettings(BaseModel):
     enabled: bool = True
     mode: str = "schedule"  # schedule, threshold, auto, manual
@@ -67,6 +75,10 @@ async def update_device_settings(device_name: str, settings: DeviceSettings):
         if not success:
             raise HTTPException(status_code=500, detail="Failed to save settings")
         
+        # Apply the new settings now rather than at the next control tick
+        if automation_engine:
+            automation_engine.request_control_pass()
+        
         return {
             "success": True,
             "message": f"Settings updated for {device_name}",
@@ -1,4 +1,5 @@
 """External Server Sync API endpoints."""
+import asyncio
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 from typing import Optional
@@ -7,6 +8,7 @@ from datetime import datetime
 from backend.database import db
 from backend.external_sync import get_sync_module
 from backend.config import DATA_DIR
+from backend.utils.files import latest_photo
 
 router = APIRouter(prefix="/api/sync", tags=["sync"])
 
@@ -71,7 +73,7 @@ async def test_sync_connection():
                 "error": "Sync module not initialized"
             }
         
-        result = sync_module.test_connection()
+        result = await asyncio.to_thread(sync_module.test_connection)
         
         return {
             "success": result.get('success', False),
@@ -120,18 +122,16 @@ async def sync_latest_photo():
         if not photos_dir.exists():
             raise HTTPException(status_code=404, detail="No photos directory")
         
-        photos = sorted(photos_dir.glob("*.jpg"))
-        if not photos:
+        photo_path = latest_photo(photos_dir)
+        if not photo_path:
             raise HTTPException(status_code=404, detail="No photos available")
         
-        latest_photo = photos[-1]
-        
         # Get active project
         project = db.get_active_project()
         project_id = project['id'] if project else None
         
         # Sync photo
-        result = sync_module.sync_photo(str(latest_photo), project_id, 'latest')
+        result = await asyncio.to_thread(sync_module.sync_photo, photo_path, project_id, 'latest')
         
         # Log sync
         db.log_sync(
@@ -175,7 +175,7 @@ async def sync_sensor_data():
         project_id = project['id'] if project else None
         
         # Sync
-        result = sync_module.sync_sensor_data(sensor_data, project_id)
+        result = await asyncio.to_thread(sync_module.sync_sensor_data, sensor_data, project_id)
         
         # Log sync
         db.log_sync(
@@ -214,8 +214,8 @@ async def get_sync_logs(sync_type: Optional[str] = None, limit: int = 50):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def _run_sync(sync_module, config: Optional[SyncConfig] = None):
-    """Background task to run full sync."""
+def _run_sync(sync_module, config: Optional[SyncConfig] = None):
+    """Background task to run full sync (runs in the thread pool)."""
     import logging
     logger = logging.getLogger(__name__)
     
@@ -228,9 +228,7 @@ async def _run_sync(sync_module, config: Optional[SyncConfig] = None):
         photo_path = None
         photos_dir = DATA_DIR / "photos"
         if photos_dir.exists():
-            photos = sorted(photos_dir.glob("*.jpg"))
-            if photos:
-                photo_path = str(photos[-1])
+            photo_path = latest_photo(photos_dir)
         
         # Get latest analysis
         analysis = None
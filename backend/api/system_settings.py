@@ -9,11 +9,15 @@ from backend.config import (
     get_settings, get_secrets, save_settings, save_secrets,
     reload_config, SETTINGS_FILE, SECRETS_FILE
 )
-from backend.task_scheduler import get_task_scheduler
-
 router = APIRouter(prefix="/api/system-settings", tags=["system-settings"])
 
 
+def get_task_scheduler():
+    """Return the global task scheduler, importing APScheduler on first use."""
+    from backend.task_scheduler import get_task_scheduler as _get_task_scheduler
+    return _get_task_scheduler()
+
+
 class TimelapseSettings(BaseModel):
     default_interval: int = 300
     default_fps: int = 30
@@ -358,11 +362,14 @@ async def run_scheduled_task(task_id: str):
         if not scheduler:
             raise HTTPException(status_code=400, detail="Scheduler not available")
         
+        if not scheduler.running:
+            raise HTTPException(status_code=409, detail="Scheduler not running")
+        
         success = scheduler.run_task_now(task_id)
         if not success:
             raise HTTPException(status_code=404, detail="Task not found")
         
-        return {"success": True, "message": f"Task {task_id} executed"}
+        return {"success": True, "message": f"Task {task_id} started"}
     except HTTPException:
         raise
     except Exception as e:
@@ -398,6 +405,12 @@ async def reload_configuration():
     """Reload configuration from files."""
     try:
         reload_config()
+        
+        # Pick up changed task schedules; a no-op if they did not change
+        scheduler = get_task_scheduler()
+        if scheduler:
+            scheduler.reload_tasks()
+        
         return {"success": True, "message": "Configuration reloaded"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
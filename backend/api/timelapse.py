@@ -1,6 +1,5 @@
 """Time-lapse API endpoints."""
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
 from typing import Optional
 from pathlib import Path
 import subprocess
@@ -8,6 +7,7 @@ from datetime import datetime
 
 from backend.database import db
 from backend.config import DATA_DIR, TIMELAPSE_FPS
+from backend.utils.files import conditional_file_response
 
 router = APIRouter(prefix="/api/timelapse", tags=["timelapse"])
 
@@ -199,15 +199,16 @@ async def list_timelapse_videos():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/videos/{filename}")
-async def download_timelapse_video(filename: str):
-    """Download a time-lapse video."""
+async def download_timelapse_video(filename: str, request: Request):
+    """Download a time-lapse video (304 if the client's copy is current)."""
     try:
         video_path = DATA_DIR / "videos" / filename
         
         if not video_path.exists():
             raise HTTPException(status_code=404, detail="Video not found")
         
-        return FileResponse(
+        return conditional_file_response(
+            request,
             video_path,
             media_type="video/mp4",
             filename=filename
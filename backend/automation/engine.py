@@ -15,16 +15,17 @@ from typing import Optional, Dict, Any
 from pathlib import Path
 
 from backend.hardware.relay import RelayController
-from backend.hardware.sensor import BME680Sensor
+from backend.hardware.sensor import BME680Sensor, publish_reading
 from backend.hardware.camera import CameraController
 from backend.database import db
 from backend.automation.scheduler import Scheduler
 from backend.config import (
     SENSOR_READ_INTERVAL, 
     DATA_LOG_INTERVAL,
+    CONTROL_INTERVAL,
     DEFAULT_DEVICE_SETTINGS,
     DEFAULT_ALERT_SETTINGS,
-    GPIO_PINS,
+    DEVICE_NAMES,
     DATA_DIR,
     get_project_timelapse_dir
 )
@@ -40,6 +41,9 @@ class AutomationEngine:
         self.running = False
         self.thread: Optional[threading.Thread] = None
         
+        # Set by stop() or request_control_pass() to end the loop's wait early
+        self._wakeup = threading.Event()
+        
         # Initialize hardware controllers with error handling
         logger.info("Initializing hardware controllers...")
         self.relay = self._init_relay()
@@ -49,9 +53,19 @@ class AutomationEngine:
         # Initialize scheduler
         self.scheduler = Scheduler()
         
-        # Track last data log time
-        self.last_data_log = datetime.now()
-        self.last_alert_check = datetime.now()
+        # Track last data log time (time.monotonic() values)
+        self.last_data_log = time.monotonic()
+        self.last_alert_check = time.monotonic()
+        
+        # id and project_id of the last logged row, published with each
+        # live reading so it keeps the shape of a sensor_logs row
+        self._last_logged_row: Dict[str, Optional[int]] = {'id': None, 'project_id': None}
+        try:
+            latest = db.get_latest_sensor_data()
+            if latest:
+                self._last_logged_row = {'id': latest['id'], 'project_id': latest['project_id']}
+        except Exception as e:
+            logger.warning(f"Could not load latest sensor row: {e}")
         
         # Track timelapse per project
         self.project_timelapse_timers: Dict[int, datetime] = {}
@@ -104,7 +118,7 @@ class AutomationEngine:
         try:
             existing_settings = db.get_all_device_settings()
             
-            for device_name in GPIO_PINS.keys():
+            for device_name in DEVICE_NAMES:
                 if device_name not in existing_settings:
                     default = DEFAULT_DEVICE_SETTINGS.get(device_name, {
                         "enabled": True,
@@ -134,6 +148,7 @@ class AutomationEngine:
         
         logger.info("Starting automation engine...")
         self.running = True
+        self._wakeup.clear()
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
         logger.info("Automation engine started")
@@ -146,6 +161,7 @@ class AutomationEngine:
         
         logger.info("Stopping automation engine...")
         self.running = False
+        self._wakeup.set()
         
         if self.thread:
             self.thread.join(timeout=10)
@@ -175,41 +191,64 @@ class AutomationEngine:
         consecutive_errors = 0
         max_consecutive_errors = 10
         
+        # Sensor reads and control passes run on two monotonic deadlines:
+        # time-based schedules are re-evaluated every CONTROL_INTERVAL
+        # against the latest reading, without reading the sensor more often
+        next_read = next_control = time.monotonic()
+        sensor_data = None
+        
         while self.running:
             try:
-                # Read sensor data
-                sensor_data = None
-                if self.sensor:
-                    try:
-                        sensor_data = self.sensor.read()
-                    except Exception as e:
-                        logger.error(f"Sensor read error: {e}")
-                        self.hardware_status['sensor'] = False
+                now = time.monotonic()
                 
-                if sensor_data:
-                    self.hardware_status['sensor'] = True
+                if now >= next_read:
+                    # After an overrun, run once now rather than bursting
+                    next_read = max(next_read + SENSOR_READ_INTERVAL, now)
                     
-                    # Log data to database periodically
-                    if (datetime.now() - self.last_data_log).total_seconds() >= DATA_LOG_INTERVAL:
-                        self._log_sensor_data(sensor_data)
-                        self.last_data_log = datetime.now()
+                    # Read sensor data
+                    sensor_data = None
+                    if self.sensor:
+                        try:
+                            sensor_data = self.sensor.read()
+                        except Exception as e:
+                            logger.error(f"Sensor read error: {e}")
+                            self.hardware_status['sensor'] = False
                     
-                    # Evaluate control logic
-                    self._evaluate_control_logic(sensor_data)
+                    if sensor_data:
+                        self.hardware_status['sensor'] = True
+                        
+                        # Log data to database periodically
+                        if now - self.last_data_log >= DATA_LOG_INTERVAL:
+                            self._log_sensor_data(sensor_data)
+                            self.last_data_log = now
+                        
+                        publish_reading(sensor_data,
+                                        row_id=self._last_logged_row['id'],
+                                        project_id=self._last_logged_row['project_id'])
+                        
+                        # Check alerts
+                        if now - self.last_alert_check >= 60:
+                            self._check_alerts(sensor_data)
+                            self.last_alert_check = now
                     
-                    # Check alerts
-                    if (datetime.now() - self.last_alert_check).total_seconds() >= 60:
-                        self._check_alerts(sensor_data)
-                        self.last_alert_check = datetime.now()
+                    # Check project-based time-lapse capture
+                    self._check_project_timelapse_capture()
                 
-                # Check project-based time-lapse capture
-                self._check_project_timelapse_capture()
+                if now >= next_control:
+                    next_control = max(next_control + CONTROL_INTERVAL, now)
+                    
+                    # Evaluate control logic (only while readings are good)
+                    if sensor_data:
+                        self._evaluate_control_logic(sensor_data)
                 
                 # Reset error counter on success
                 consecutive_errors = 0
                 
-                # Sleep before next iteration
-                time.sleep(SENSOR_READ_INTERVAL)
+                # Sleep until whichever deadline comes first, or until woken
+                delay = min(next_read, next_control) - time.monotonic()
+                if delay > 0 and self._wakeup.wait(delay):
+                    self._wakeup.clear()
+                    next_control = time.monotonic()
                 
             except Exception as e:
                 consecutive_errors += 1
@@ -218,10 +257,12 @@ class AutomationEngine:
                 # If too many consecutive errors, wait longer
                 if consecutive_errors >= max_consecutive_errors:
                     logger.warning(f"Too many consecutive errors, backing off for 60 seconds")
-                    time.sleep(60)
+                    self._wakeup.wait(60)
                     consecutive_errors = 0
                 else:
-                    time.sleep(SENSOR_READ_INTERVAL)
+                    self._wakeup.wait(SENSOR_READ_INTERVAL)
+                self._wakeup.clear()
+                next_read = next_control = time.monotonic()
     
     def _resume_timelapse_timers(self):
         """Resume timelapse timers from database for active projects."""
@@ -253,7 +294,7 @@ class AutomationEngine:
             project = db.get_active_project()
             project_id = project['id'] if project else None
             
-            db.log_sensor_data(
+            row_id = db.log_sensor_data(
                 project_id=project_id,
                 temperature=sensor_data['temperature'],
                 humidity=sensor_data['humidity'],
@@ -261,6 +302,7 @@ class AutomationEngine:
                 gas_resistance=sensor_data['gas_resistance']
             )
             
+            self._last_logged_row = {'id': row_id, 'project_id': project_id}
             logger.debug(f"Logged sensor data for project {project_id}")
             
         except Exception as e:
@@ -277,7 +319,10 @@ class AutomationEngine:
             
             all_settings = db.get_all_device_settings()
             
-            for device_name in GPIO_PINS.keys():
+            # One snapshot of the relay states serves the whole pass
+            device_states = self.relay.get_all_states()
+            
+            for device_name in DEVICE_NAMES:
                 try:
                     settings = all_settings.get(device_name, DEFAULT_DEVICE_SETTINGS.get(device_name, {}))
                     
@@ -288,7 +333,7 @@ class AutomationEngine:
                     if should_be_on is None:
                         continue
                     
-                    current_state = self.relay.get_state(device_name)
+                    current_state = device_states.get(device_name, False)
                     
                     if should_be_on and not current_state:
                         logger.info(f"Turning ON {device_name} (auto control)")
@@ -499,6 +544,14 @@ class AutomationEngine:
             for pid, status in self.project_timelapse_status.items()
         }
     
+    def request_control_pass(self):
+        """Re-evaluate device control now instead of at the next tick.
+        
+        Called after device settings change so a new schedule or threshold
+        takes effect immediately.
+        """
+        self._wakeup.set()
+    
     # Manual control methods
     
     def turn_device_on(self, device_name: str) -> bool:
@@ -547,6 +600,15 @@ class AutomationEngine:
             logger.error(f"Error reading sensor: {e}")
             return None
     
+    @staticmethod
+    def _photo_path(filepath: Optional[str]) -> Path:
+        """Target path for a manual photo (timestamped if not given)."""
+        if not filepath:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # capture_image() creates the directory if needed
+            filepath = str(DATA_DIR / "photos" / f"photo_{timestamp}.jpg")
+        return Path(filepath)
+    
     def capture_photo(self, filepath: Optional[str] = None) -> Optional[str]:
         """Capture a photo with the camera."""
         if not self.camera:
@@ -554,13 +616,20 @@ class AutomationEngine:
             return None
         
         try:
-            if not filepath:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                photos_dir = DATA_DIR / "photos"
-                photos_dir.mkdir(parents=True, exist_ok=True)
-                filepath = str(photos_dir / f"photo_{timestamp}.jpg")
-            
-            captured_path = self.camera.capture_image(Path(filepath))
+            captured_path = self.camera.capture_image(self._photo_path(filepath))
+            return str(captured_path) if captured_path else None
+        except Exception as e:
+            logger.error(f"Error capturing photo: {e}")
+            return None
+    
+    async def capture_photo_async(self, filepath: Optional[str] = None) -> Optional[str]:
+        """Capture a photo with the camera from async code."""
+        if not self.camera:
+            logger.error("Camera not available")
+            return None
+        
+        try:
+            captured_path = await self.camera.capture_image_async(self._photo_path(filepath))
             return str(captured_path) if captured_path else None
         except Exception as e:
             logger.error(f"Error capturing photo: {e}")
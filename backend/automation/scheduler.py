@@ -1,10 +1,27 @@
 """Scheduling logic for device control."""
 import logging
 from datetime import datetime, time as dt_time, timedelta
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=256)
+def _parse_hhmm(value: str) -> dt_time:
+    """Parse (once per string) an "HH:MM" schedule time.
+    
+    Raises:
+        ValueError: If the value is not a valid "HH:MM" time
+    """
+    return datetime.strptime(value, "%H:%M").time()
+
+
+def _minute_of_day(value: dt_time) -> int:
+    """Return the minute of the day (0-1439) for a time."""
+    return value.hour * 60 + value.minute
+
+
 class Scheduler:
     """Handles scheduling logic for device control."""
     
@@ -31,22 +48,24 @@ class Scheduler:
         if current_time is None:
             current_time = datetime.now()
         
-        current_time_obj = current_time.time()
+        current_minute = _minute_of_day(current_time)
         
         for entry in schedule:
             # Handle simple on/off schedule
             if 'on' in entry and 'off' in entry:
                 try:
-                    on_time = datetime.strptime(entry['on'], "%H:%M").time()
-                    off_time = datetime.strptime(entry['off'], "%H:%M").time()
+                    # Schedule times have minute resolution, so whole
+                    # minutes of the day compare the same as time objects
+                    on_minute = _minute_of_day(_parse_hhmm(entry['on']))
+                    off_minute = _minute_of_day(_parse_hhmm(entry['off']))
                     
-                    if on_time <= off_time:
+                    if on_minute <= off_minute:
                         # Same day range (e.g., 06:00 to 22:00)
-                        if on_time <= current_time_obj < off_time:
+                        if on_minute <= current_minute < off_minute:
                             return True
                     else:
                         # Crosses midnight (e.g., 22:00 to 06:00)
-                        if current_time_obj >= on_time or current_time_obj < off_time:
+                        if current_minute >= on_minute or current_minute < off_minute:
                             return True
                 except ValueError as e:
                     logger.error(f"Invalid time format in schedule for {device_name}: {e}")
@@ -82,7 +101,7 @@ class Scheduler:
             # Handle specific time with duration (e.g., pump at 08:00 for 5 min)
             elif 'time' in entry and 'duration' in entry:
                 try:
-                    trigger_time = datetime.strptime(entry['time'], "%H:%M").time()
+                    trigger_time = _parse_hhmm(entry['time'])
                     duration_min = entry['duration']
                     
                     # Create datetime object for comparison
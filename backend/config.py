@@ -74,26 +74,54 @@ def save_yaml_file(filepath: Path, data: Dict[str, Any]) -> bool:
 _settings: Dict[str, Any] = {}
 _secrets: Dict[str, Any] = {}
 
+# Modification time of each file when it was last loaded; a file is re-read
+# only when its mtime changes, so repeated lookups cost one stat()
+_loaded_mtimes: Dict[Path, Optional[int]] = {}
 
-def load_config() -> None:
-    """Load all configuration from YAML files."""
-    global _settings, _secrets
+
+def _file_mtime(filepath: Path) -> Optional[int]:
+    """Get a file's modification time in nanoseconds, or None if missing."""
+    try:
+        return filepath.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_stale(filepath: Path) -> bool:
+    """Check whether a config file changed since it was last loaded."""
+    return filepath not in _loaded_mtimes or _loaded_mtimes[filepath] != _file_mtime(filepath)
+
+
+def _load_settings() -> None:
+    global _settings
+    _loaded_mtimes[SETTINGS_FILE] = _file_mtime(SETTINGS_FILE)
     _settings = load_yaml_file(SETTINGS_FILE)
+
+
+def _load_secrets() -> None:
+    global _secrets
+    _loaded_mtimes[SECRETS_FILE] = _file_mtime(SECRETS_FILE)
     _secrets = load_yaml_file(SECRETS_FILE)
+
+
+def load_config() -> None:
+    """Load all configuration from YAML files."""
+    _load_settings()
+    _load_secrets()
     logger.info("Configuration loaded from YAML files")
 
 
 def get_settings() -> Dict[str, Any]:
-    """Get all settings (non-sensitive config)."""
-    if not _settings:
-        load_config()
+    """Get all settings (non-sensitive config), re-reading the file if it changed."""
+    if _is_stale(SETTINGS_FILE):
+        _load_settings()
     return _settings
 
 
 def get_secrets() -> Dict[str, Any]:
-    """Get all secrets (sensitive config)."""
-    if not _secrets:
-        load_config()
+    """Get all secrets (sensitive config), re-reading the file if it changed."""
+    if _is_stale(SECRETS_FILE):
+        _load_secrets()
     return _secrets
 
 
@@ -101,14 +129,18 @@ def save_settings(settings: Dict[str, Any]) -> bool:
     """Save settings to the settings.yaml file."""
     global _settings
     _settings = settings
-    return save_yaml_file(SETTINGS_FILE, settings)
+    saved = save_yaml_file(SETTINGS_FILE, settings)
+    _loaded_mtimes[SETTINGS_FILE] = _file_mtime(SETTINGS_FILE)
+    return saved
 
 
 def save_secrets(secrets: Dict[str, Any]) -> bool:
     """Save secrets to the secrets.yaml file."""
     global _secrets
     _secrets = secrets
-    return save_yaml_file(SECRETS_FILE, secrets)
+    saved = save_yaml_file(SECRETS_FILE, secrets)
+    _loaded_mtimes[SECRETS_FILE] = _file_mtime(SECRETS_FILE)
+    return saved
 
 
 def get_setting(key: str, default: Any = None) -> Any:
@@ -159,9 +191,7 @@ def get_secret(key: str, default: Any = None) -> Any:
 
 def reload_config() -> None:
     """Reload configuration from files."""
-    global _settings, _secrets
-    _settings = {}
-    _secrets = {}
+    _loaded_mtimes.clear()
     load_config()
 
 
@@ -187,6 +217,9 @@ GPIO_PINS = get_setting('gpio_pins', {
     "dehumidifier":      24,
 })
 
+# Device names in GPIO_PINS order (fixed for the process lifetime)
+DEVICE_NAMES = tuple(GPIO_PINS.keys())
+
 # Human-readable display names for devices
 DEVICE_DISPLAY_NAMES = {
     "lights": "Lights",
@@ -212,6 +245,7 @@ TELEGRAM_CHAT_ID = get_secret('telegram.chat_id',
 # Sensor reading intervals
 SENSOR_READ_INTERVAL = get_setting('sensor.read_interval', 30)
 DATA_LOG_INTERVAL = get_setting('sensor.log_interval', 60)
+CONTROL_INTERVAL = get_setting('sensor.control_interval', 5)
 
 # Time-lapse settings
 TIMELAPSE_INTERVAL = get_setting('timelapse.default_interval', 300)
@@ -230,6 +264,13 @@ CAMERA_ROTATION = _camera_config.get('rotation', 0)
 HOST = get_setting('server.host', "0.0.0.0")
 PORT = get_setting('server.port', 8000)
 
+# Origins allowed to call the API cross-origin (the bundled UI is same-origin)
+CORS_ORIGINS = get_setting('server.cors_origins', [
+    f"http://localhost:{PORT}",
+    f"http://127.0.0.1:{PORT}",
+    f"http://raspberrypi.local:{PORT}",
+])
+
 # Alert settings
 _alert_config = get_setting('alerts', {})
 DEFAULT_ALERT_SETTINGS = {
@@ -335,6 +376,28 @@ def get_device_display_name(device_name: str) -> str:
     return DEVICE_DISPLAY_NAMES.get(device_name, device_name.replace('_', ' ').title())
 
 
+# Directories created (or found) by ensure_dir() during this process
+_ensured_dirs = set()
+
+
+def ensure_dir(directory: Path) -> Path:
+    """Create a directory (and parents) once per process.
+    
+    Later calls for the same path skip the mkdir syscalls; the app never
+    removes directories it has created.
+    
+    Args:
+        directory: Directory to create
+        
+    Returns:
+        The same directory
+    """
+    if directory not in _ensured_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(directory)
+    return directory
+
+
 def get_project_timelapse_dir(project_id: int) -> Path:
     """Get the timelapse directory for a specific project.
     
@@ -344,9 +407,7 @@ def get_project_timelapse_dir(project_id: int) -> Path:
     Returns:
         Path to project's timelapse directory
     """
-    project_dir = DATA_DIR / "projects" / str(project_id) / "timelapse"
-    project_dir.mkdir(parents=True, exist_ok=True)
-    return project_dir
+    return ensure_dir(DATA_DIR / "projects" / str(project_id) / "timelapse")
 
 
 def get_project_data_dir(project_id: int) -> Path:
@@ -358,6 +419,4 @@ def get_project_data_dir(project_id: int) -> Path:
     Returns:
         Path to project's data directory
     """
-    project_dir = DATA_DIR / "projects" / str(project_id)
-    project_dir.mkdir(parents=True, exist_ok=True)
-    return project_dir
+    return ensure_dir(DATA_DIR / "projects" / str(project_id))
@@ -3,7 +3,7 @@ import sqlite3
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from contextlib import contextmanager
 import threading
 import logging
@@ -12,6 +12,9 @@ from backend.config import DATABASE_PATH
 
 logger = logging.getLogger(__name__)
 
+# Value columns of sensor_logs that may be selected individually
+SENSOR_COLUMNS = ('timestamp', 'temperature', 'humidity', 'pressure', 'gas_resistance')
+
 
 class Database:
     """Thread-safe database manager."""
@@ -98,6 +101,12 @@ class Database:
                 ON sensor_logs(project_id)
             """)
             
+            # Per-project time range queries (reports, statistics)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sensor_logs_project_timestamp 
+                ON sensor_logs(project_id, timestamp)
+            """)
+            
             # Diary entries table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS diary_entries (
@@ -347,6 +356,27 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    @staticmethod
+    def _sensor_filter(project_id: Optional[int], start_date: Optional[datetime],
+                       end_date: Optional[datetime]) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause shared by the sensor_logs queries."""
+        where = " WHERE 1=1"
+        params: List[Any] = []
+        
+        if project_id:
+            where += " AND project_id = ?"
+            params.append(project_id)
+        
+        if start_date:
+            where += " AND timestamp >= ?"
+            params.append(start_date)
+        
+        if end_date:
+            where += " AND timestamp <= ?"
+            params.append(end_date)
+        
+        return where, params
+    
     def get_sensor_data(self, project_id: Optional[int] = None, 
                        start_date: Optional[datetime] = None,
                        end_date: Optional[datetime] = None,
@@ -354,26 +384,71 @@ class Database:
         """Get sensor data with optional filters."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            query = "SELECT * FROM sensor_logs WHERE 1=1"
-            params = []
+            where, params = self._sensor_filter(project_id, start_date, end_date)
+            query = "SELECT * FROM sensor_logs" + where
             
-            if project_id:
-                query += " AND project_id = ?"
-                params.append(project_id)
+            query += " ORDER BY timestamp DESC LIMIT ?"
+            params.append(limit)
             
-            if start_date:
-                query += " AND timestamp >= ?"
-                params.append(start_date)
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def get_sensor_columns(self, columns: Sequence[str],
+                           project_id: Optional[int] = None,
+                           start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None,
+                           limit: int = 1000) -> Dict[str, List[Any]]:
+        """Get selected sensor columns as parallel lists.
+        
+        Only the requested columns are read and no per-row dicts are built,
+        which suits callers that reduce a few columns over many rows.
+        
+        Args:
+            columns: Column names, each one of SENSOR_COLUMNS
             
-            if end_date:
-                query += " AND timestamp <= ?"
-                params.append(end_date)
+        Returns:
+            Dict mapping each column to its values, newest first
+        """
+        unknown = set(columns) - set(SENSOR_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown sensor columns: {sorted(unknown)}")
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            where, params = self._sensor_filter(project_id, start_date, end_date)
+            query = f"SELECT {', '.join(columns)} FROM sensor_logs" + where
             
             query += " ORDER BY timestamp DESC LIMIT ?"
             params.append(limit)
             
             cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            rows = cursor.fetchall()
+            if not rows:
+                return {column: [] for column in columns}
+            return dict(zip(columns, map(list, zip(*rows))))
+    
+    def get_sensor_aggregates(self, project_id: Optional[int] = None,
+                              start_date: Optional[datetime] = None,
+                              end_date: Optional[datetime] = None) -> Dict[str, Any]:
+        """Get min/max/avg temperature and humidity computed by SQLite.
+        
+        Returns:
+            Dict with t_min, t_max, t_avg, h_min, h_max, h_avg (None when there
+            are no values) and n, the number of matching readings
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            where, params = self._sensor_filter(project_id, start_date, end_date)
+            query = """
+                SELECT MIN(temperature) AS t_min, MAX(temperature) AS t_max,
+                       AVG(temperature) AS t_avg,
+                       MIN(humidity) AS h_min, MAX(humidity) AS h_max,
+                       AVG(humidity) AS h_avg,
+                       COUNT(*) AS n
+                FROM sensor_logs""" + where
+            
+            cursor.execute(query, params)
+            return dict(cursor.fetchone())
     
     # Device settings methods
     def get_device_settings(self, device_name: str) -> Optional[Dict[str, Any]]:
@@ -724,6 +799,69 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    def get_status_bundle(self, sync_type: str = 'full') -> Dict[str, Any]:
+        """Get everything the health/status endpoints show in one transaction.
+        
+        Runs the latest-row queries on a single cursor inside one read
+        transaction, so the results are consistent and the connection is
+        taken only once.
+        
+        Args:
+            sync_type: Sync type for the last successful sync
+        
+        Returns:
+            Dict with active_project (including timelapse_count), sensor_data,
+            latest_analysis and last_sync; missing rows are None
+        """
+        def fetch_one(cursor) -> Optional[Dict[str, Any]]:
+            row = cursor.fetchone()
+            return dict(row) if row else None
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if not conn.in_transaction:
+                cursor.execute("BEGIN DEFERRED")
+            try:
+                cursor.execute("""
+                    SELECT * FROM projects WHERE status = 'active'
+                    ORDER BY start_date DESC LIMIT 1
+                """)
+                active_project = fetch_one(cursor)
+                
+                if active_project:
+                    cursor.execute(
+                        "SELECT COUNT(*) as count FROM timelapse_images WHERE project_id = ?",
+                        (active_project['id'],)
+                    )
+                    active_project['timelapse_count'] = cursor.fetchone()['count']
+                
+                cursor.execute("""
+                    SELECT * FROM sensor_logs ORDER BY timestamp DESC LIMIT 1
+                """)
+                sensor_data = fetch_one(cursor)
+                
+                cursor.execute("""
+                    SELECT * FROM ai_analysis
+                    ORDER BY timestamp DESC LIMIT 1
+                """)
+                latest_analysis = fetch_one(cursor)
+                
+                cursor.execute("""
+                    SELECT * FROM sync_log
+                    WHERE sync_type = ? AND status = 'success'
+                    ORDER BY timestamp DESC LIMIT 1
+                """, (sync_type,))
+                last_sync = fetch_one(cursor)
+            finally:
+                conn.commit()
+            
+            return {
+                'active_project': active_project,
+                'sensor_data': sensor_data,
+                'latest_analysis': latest_analysis,
+                'last_sync': last_sync,
+            }
+    
     # Scheduled tasks methods (NEW)
     def save_scheduled_task(self, task_id: str, task_name: str,
                            schedule_type: str, schedule_value: str,
@@ -740,6 +878,25 @@ class Database:
             conn.commit()
             return True
     
+    def save_scheduled_tasks_bulk(self, rows: List[tuple]) -> bool:
+        """Save or update several scheduled tasks in one transaction.
+        
+        Args:
+            rows: (task_id, task_name, schedule_type, schedule_value, enabled) tuples
+        """
+        if not rows:
+            return True
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO scheduled_tasks 
+                (id, task_name, schedule_type, schedule_value, enabled)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(task_id, name, stype, value, 1 if enabled else 0)
+                  for task_id, name, stype, value, enabled in rows])
+            conn.commit()
+            return True
+    
     def get_scheduled_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get a scheduled task by ID."""
         with self.get_connection() as conn:
@@ -756,8 +913,10 @@ class Database:
             return [dict(row) for row in cursor.fetchall()]
     
     def update_task_run_time(self, task_id: str, 
-                            next_run: Optional[datetime] = None) -> bool:
-        """Update task last run time and optionally next run."""
+                            next_run: Optional[datetime] = None,
+                            last_run: Optional[datetime] = None) -> bool:
+        """Update task last run time (default now) and optionally next run."""
+        last_run = last_run or datetime.now()
         with self.get_connection() as conn:
             cursor = conn.cursor()
             if next_run:
@@ -765,13 +924,13 @@ class Database:
                     UPDATE scheduled_tasks 
                     SET last_run = ?, next_run = ?, run_count = run_count + 1
                     WHERE id = ?
-                """, (datetime.now(), next_run, task_id))
+                """, (last_run, next_run, task_id))
             else:
                 cursor.execute("""
                     UPDATE scheduled_tasks 
                     SET last_run = ?, run_count = run_count + 1
                     WHERE id = ?
-                """, (datetime.now(), task_id))
+                """, (last_run, task_id))
             conn.commit()
             return cursor.rowcount > 0
     
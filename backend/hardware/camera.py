@@ -3,19 +3,95 @@
 Handles camera initialization, snapshots, and video streaming via subprocess.
 Uses the rpicam-jpeg command which is part of libcamera-apps.
 """
+import asyncio
+import atexit
+import io
+import itertools
 import logging
+import os
+import re
 import subprocess
 import time
 import shutil
+import queue
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional, Tuple
-from datetime import datetime
+from typing import Optional, Tuple, Dict, Callable, Iterator
 import threading
+from functools import lru_cache
 
-from backend.config import CAMERA_RESOLUTION, CAMERA_ROTATION, DATA_DIR
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo_jpeg = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+    TURBOJPEG_AVAILABLE = False
+
+from backend.config import CAMERA_RESOLUTION, CAMERA_ROTATION, DATA_DIR, ensure_dir
 
 logger = logging.getLogger(__name__)
 
+SIMULATION_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+SIMULATION_BACKGROUND = (73, 109, 137)
+SIMULATION_STREAM_SIZE = (640, 480)
+SIMULATION_JPEG_QUALITY = 75
+
+# JPEG start/end-of-image markers used to split an MJPEG byte stream
+JPEG_SOI = b"\xff\xd8"
+JPEG_EOI = b"\xff\xd9"
+STREAM_READ_SIZE = 1024 * 1024
+# Longest wait for the next frame of a running stream before giving up
+STREAM_FRAME_TIMEOUT = 10.0
+
+# One sensor mode in `rpicam-jpeg --list-cameras` output, e.g.
+# "'SRGGB12_CSI2P' : 2028x1520 [40.01 fps - (0, 0)/4056x3040 crop]";
+# modes listed without a format string share the bit depth of the
+# previous one. The crop is the sensor window the mode reads out.
+_SENSOR_MODE_RE = re.compile(
+    r"(?:'S[A-Z]{4}(\d+)\w*'\s*:\s*)?(\d+)x(\d+) \[[^\]]*?/(\d+)x(\d+) crop\]"
+)
+
+# Last encoded simulation stream frame, re-rendered at most once per second
+_sim_cache = {"sec": -1, "bytes": b""}
+
+
+@lru_cache(maxsize=8)
+def _get_font(size: int):
+    """Load (once per size) the font used for simulation images."""
+    try:
+        return ImageFont.truetype(SIMULATION_FONT_PATH, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=4)
+def _get_background(resolution: Tuple[int, int]):
+    """Build (once per resolution) the blank simulation image template."""
+    return Image.new('RGB', resolution, color=SIMULATION_BACKGROUND)
+
+
+def _encode_jpeg(img, quality: int = SIMULATION_JPEG_QUALITY) -> bytes:
+    """Encode a PIL image as JPEG, using libjpeg-turbo when available."""
+    if TURBOJPEG_AVAILABLE:
+        # PIL buffers are contiguous RGB; a reversed-channel view would hand
+        # libjpeg-turbo a misaligned pointer, so declare the order instead
+        return _turbo_jpeg.encode(np.asarray(img), quality=quality,
+                                  pixel_format=TJPF_RGB)
+    
+    stream = io.BytesIO()
+    img.save(stream, format='JPEG', quality=quality,
+             optimize=False, progressive=False)
+    return stream.getvalue()
+
+
 class CameraController:
     """Raspberry Pi HQ Camera interface using rpicam-jpeg command."""
     
@@ -31,13 +107,52 @@ class CameraController:
         self.rotation = rotation
         self.simulation_mode = False
         self.is_initialized = False
+        
+        # Captures are serialized through a single worker thread; requests for
+        # the same target that arrive while one is in flight share its Future.
         self._lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._inflight: Dict[str, Future] = {}
+        self._worker: Optional[threading.Thread] = None
+        
+        # One rpicam-vid process feeds every /stream client. libcamera gives
+        # the sensor to a single process, so stills taken while it runs
+        # reuse its frames; _stream_cond guards the fields below.
+        self._stream_cond = threading.Condition()
+        self._stream_proc: Optional[subprocess.Popen] = None
+        self._stream_clients = 0
+        self._stream_frame: Optional[bytes] = None
+        self._stream_seq = 0
+        self._stream_ids = itertools.count()
         
         # Latest snapshot path for live feed
         self.latest_snapshot_path = DATA_DIR / "photos" / "latest_snapshot.jpg"
         
+        # Live feed reuses a snapshot younger than _cache_ttl seconds;
+        # get_latest_snapshot() treats one older than stale_after as missing
+        self._cache_ttl = 2.0
+        self.stale_after = 300.0
+        
+        # "--mode" argument for the sensor mode matching self.resolution,
+        # resolved on first capture ("" = let libcamera choose)
+        self._sensor_mode: Optional[str] = None
+        
+        # Write time of latest_snapshot_path, tracked in memory to avoid a
+        # stat() per live-feed poll (0.0 = no snapshot)
+        try:
+            self._latest_mtime = self.latest_snapshot_path.stat().st_mtime
+        except OSError:
+            self._latest_mtime = 0.0
+        
         # Check if rpicam-jpeg is available
         self._check_camera_available()
+        
+        if not self.simulation_mode:
+            self._worker = threading.Thread(
+                target=self._capture_loop, name="camera-capture", daemon=True
+            )
+            self._worker.start()
+            atexit.register(self.cleanup)
     
     def _check_camera_available(self):
         """Check if rpicam-jpeg command is available."""
@@ -81,82 +196,278 @@ class CameraController:
             return "libcamera-jpeg"
         return "rpicam-jpeg"
     
-    def capture_image(self, filepath: Optional[Path] = None) -> Optional[Path]:
-        """Capture a still image using rpicam-jpeg.
+    def _submit(self, key: str, func: Callable, *args) -> Future:
+        """Queue a capture job for the worker thread (single-flight per key).
+        
+        Args:
+            key: Coalescing key; callers with the same key share one capture
+            func: Capture function to run on the worker thread
+            *args: Arguments for func
+            
+        Returns:
+            Future resolving to the result of func
+        """
+        if self._worker is None:
+            # Worker stopped (after cleanup) - capture inline
+            future = Future()
+            future.set_result(func(*args))
+            return future
+        
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = Future()
+            self._inflight[key] = future
+            self._queue.put((key, future, func, args))
+        return future
+    
+    def _capture_loop(self):
+        """Worker thread: run queued captures one at a time."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            
+            key, future, func, args = job
+            try:
+                result = func(*args)
+            except Exception as e:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                future.set_exception(e)
+            else:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                future.set_result(result)
+    
+    def _get_video_command(self) -> str:
+        """Get the video command matching the still-capture command."""
+        if hasattr(self, '_use_libcamera_jpeg') and self._use_libcamera_jpeg:
+            return "libcamera-vid"
+        return "rpicam-vid"
+    
+    def _get_sensor_mode(self) -> str:
+        """Pick the sensor mode to capture in for the configured resolution.
+        
+        Chooses the smallest mode that covers the output size, so the
+        sensor bins and the ISP scales straight to the requested size
+        instead of reading out every pixel for every frame. Only modes
+        that read the whole sensor array are considered; cropped modes
+        (e.g. the IMX477's 1332x990) would narrow the field of view.
+        
+        The choice is cached once the modes have been listed. If listing
+        fails (e.g. another process holds the camera), the next capture
+        tries again.
+        
+        Returns:
+            Mode as "W:H:bit-depth:P" for --mode, or "" if the modes
+            could not be listed
+        """
+        if self._sensor_mode is not None:
+            return self._sensor_mode
+        
+        modes = []
+        try:
+            result = subprocess.run(
+                [self._get_camera_command(), "--list-cameras"],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        except Exception as e:
+            logger.warning(f"Could not list sensor modes: {e}")
+            return ""
+        
+        if result.returncode != 0:
+            # Usually the camera is busy; leave the cache empty to retry
+            logger.warning(f"Could not list sensor modes: {result.stderr.strip()}")
+            return ""
+        
+        depth = None
+        for match in _SENSOR_MODE_RE.finditer(result.stdout):
+            depth = match.group(1) or depth
+            if depth:
+                modes.append((int(match.group(2)), int(match.group(3)), depth,
+                              int(match.group(4)), int(match.group(5))))
+        
+        if not modes:
+            # Listing worked but shows no usable modes; don't ask again
+            self._sensor_mode = ""
+            return self._sensor_mode
+        
+        # Keep the modes whose crop is the full array (the largest crop)
+        full_crop = max(((m[3], m[4]) for m in modes), key=lambda c: c[0] * c[1])
+        modes = [m for m in modes if (m[3], m[4]) == full_crop]
+        
+        width, height = self.resolution
+        covering = [m for m in modes if m[0] >= width and m[1] >= height]
+        if covering:
+            mode = min(covering, key=lambda m: m[0] * m[1])
+        else:
+            mode = max(modes, key=lambda m: m[0] * m[1])
+        
+        self._sensor_mode = f"{mode[0]}:{mode[1]}:{mode[2]}:P"
+        logger.info(f"Using sensor mode {mode[0]}x{mode[1]} for {width}x{height} output")
+        return self._sensor_mode
+    
+    def _build_capture_command(self, output: str) -> list:
+        """Build the rpicam-jpeg command line for a single capture.
+        
+        Args:
+            output: Output path, or "-" to write the JPEG to stdout
+            
+        Returns:
+            Command as a list of arguments
+        """
+        command = [
+            self._get_camera_command(),
+            "-o", output,
+            "--width", str(self.resolution[0]),
+            "--height", str(self.resolution[1]),
+            "-n",  # No preview
+            "-t", "1"  # Minimum timeout (1ms, will capture immediately)
+        ]
+        
+        sensor_mode = self._get_sensor_mode()
+        if sensor_mode:
+            command.extend(["--mode", sensor_mode])
+        
+        # Add rotation if needed
+        if self.rotation == 180:
+            command.extend(["--hflip", "--vflip"])
+        elif self.rotation == 90:
+            command.extend(["--rotation", "90"])
+        elif self.rotation == 270:
+            command.extend(["--rotation", "270"])
+        
+        return command
+    
+    def _capture_path(self, filepath: Optional[Path]) -> Path:
+        """Resolve a capture target and make sure its directory exists.
         
         Args:
             filepath: Path to save image. If None, generates timestamped filename.
             
         Returns:
-            Path to saved image or None if capture failed
+            Target path
         """
         if not filepath:
             # Generate timestamped filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filepath = DATA_DIR / "photos" / f"capture_{timestamp}.jpg"
         
         # Ensure filepath is a Path object
         filepath = Path(filepath)
         
         # Ensure directory exists
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(filepath.parent)
+        return filepath
+    
+    def _note_capture(self, captured: Optional[Path]) -> Optional[Path]:
+        """Record a capture over the latest snapshot and pass it through."""
+        if captured == self.latest_snapshot_path:
+            self._latest_mtime = time.time()
+        return captured
+    
+    def capture_image(self, filepath: Optional[Path] = None) -> Optional[Path]:
+        """Capture a still image using rpicam-jpeg.
+        
+        Blocks until the capture worker has taken the picture; async code
+        should use capture_image_async() instead.
+        
+        Args:
+            filepath: Path to save image. If None, generates timestamped filename.
+            
+        Returns:
+            Path to saved image or None if capture failed
+        """
+        filepath = self._capture_path(filepath)
         
         if self.simulation_mode:
-            return self._create_simulation_image(filepath)
+            captured = self._create_simulation_image(filepath)
+        else:
+            captured = self._submit(str(filepath), self._capture_to_file, filepath).result()
         
-        with self._lock:
-            try:
-                cmd = self._get_camera_command()
-                
-                # Build command with arguments
-                command = [
-                    cmd,
-                    "-o", str(filepath),
-                    "--width", str(self.resolution[0]),
-                    "--height", str(self.resolution[1]),
-                    "-n",  # No preview
-                    "-t", "1"  # Minimum timeout (1ms, will capture immediately)
-                ]
-                
-                # Add rotation if needed
-                if self.rotation == 180:
-                    command.extend(["--hflip", "--vflip"])
-                elif self.rotation == 90:
-                    command.extend(["--rotation", "90"])
-                elif self.rotation == 270:
-                    command.extend(["--rotation", "270"])
-                
-                logger.debug(f"Running camera command: {' '.join(command)}")
+        return self._note_capture(captured)
+    
+    async def capture_image_async(self, filepath: Optional[Path] = None) -> Optional[Path]:
+        """Capture a still image without blocking the event loop.
+        
+        Awaits the capture worker's Future directly, so no executor thread
+        is tied up waiting on the camera.
+        
+        Args:
+            filepath: Path to save image. If None, generates timestamped filename.
+            
+        Returns:
+            Path to saved image or None if capture failed
+        """
+        filepath = self._capture_path(filepath)
+        
+        if self.simulation_mode:
+            captured = await asyncio.to_thread(self._create_simulation_image, filepath)
+        else:
+            captured = await asyncio.wrap_future(
+                self._submit(str(filepath), self._capture_to_file, filepath)
+            )
+        
+        return self._note_capture(captured)
+    
+    def _capture_to_file(self, filepath: Path) -> Optional[Path]:
+        """Run rpicam-jpeg to capture into filepath (worker thread only).
+        
+        Args:
+            filepath: Path to save image
+            
+        Returns:
+            Path to saved image or None if capture failed
+        """
+        try:
+            self._unlink_snapshot_target(filepath)
+            
+            frame = self._frame_from_stream()
+            if frame is not None:
+                filepath.write_bytes(frame)
+                logger.info(f"Image captured from stream: {filepath}")
+                self._update_latest_snapshot(filepath)
+                return filepath
+            
+            command = self._build_capture_command(str(filepath))
+            
+            logger.debug("Running camera command: %s", command)
+            
+            # Execute capture
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                timeout=30  # 30 second timeout
+            )
+            
+            # A failed capture returns None rather than a placeholder, so
+            # the "Camera not available" image never lands in a real photo
+            if result.returncode != 0:
+                logger.error(f"Camera capture failed: {result.stderr}")
+                return None
+            
+            if filepath.exists():
+                logger.info(f"Image captured: {filepath}")
                 
-                # Execute capture
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    timeout=30  # 30 second timeout
-                )
+                # Update latest snapshot
+                self._update_latest_snapshot(filepath)
                 
-                if result.returncode != 0:
-                    logger.error(f"Camera capture failed: {result.stderr}")
-                    return self._create_simulation_image(filepath)
+                return filepath
+            else:
+                logger.error("Capture succeeded but file not found")
+                return None
                 
-                if filepath.exists():
-                    logger.info(f"Image captured: {filepath}")
-                    
-                    # Update latest snapshot
-                    self._update_latest_snapshot(filepath)
-                    
-                    return filepath
-                else:
-                    logger.error("Capture succeeded but file not found")
-                    return None
-                    
-            except subprocess.TimeoutExpired:
-                logger.error("Camera capture timed out")
-                return self._create_simulation_image(filepath)
-            except Exception as e:
-                logger.error(f"Error capturing image: {e}")
-                return self._create_simulation_image(filepath)
+        except subprocess.TimeoutExpired:
+            logger.error("Camera capture timed out")
+            return None
+        except Exception as e:
+            logger.error(f"Error capturing image: {e}")
+            return None
     
     def _update_latest_snapshot(self, source_path: Path):
         """Update the latest snapshot file for live feed.
@@ -164,12 +475,39 @@ class CameraController:
         Args:
             source_path: Path to the source image
         """
+        if source_path == self.latest_snapshot_path:
+            return
+        
         try:
-            self.latest_snapshot_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_path, self.latest_snapshot_path)
+            ensure_dir(self.latest_snapshot_path.parent)
+            
+            # Hard-link the new photo instead of copying megabytes of JPEG;
+            # swapping it in with os.replace means readers never see a gap
+            tmp_path = self.latest_snapshot_path.with_name(self.latest_snapshot_path.name + ".tmp")
+            tmp_path.unlink(missing_ok=True)
+            try:
+                os.link(source_path, tmp_path)
+            except OSError:
+                # Filesystem without hard links
+                shutil.copy2(source_path, tmp_path)
+            os.replace(tmp_path, self.latest_snapshot_path)
+            self._latest_mtime = time.time()
         except Exception as e:
             logger.warning(f"Failed to update latest snapshot: {e}")
     
+    def _unlink_snapshot_target(self, filepath: Path):
+        """Remove the latest snapshot before capturing over it.
+        
+        The latest snapshot may be a hard link to a stored photo; writing
+        into it in place would overwrite that photo too, so captures to
+        that path always start from a new file.
+        
+        Args:
+            filepath: Capture target
+        """
+        if filepath == self.latest_snapshot_path:
+            filepath.unlink(missing_ok=True)
+    
     def _create_simulation_image(self, filepath: Path) -> Optional[Path]:
         """Create a simulation/placeholder image.
         
@@ -180,19 +518,21 @@ class CameraController:
             Path to saved image or None if failed
         """
         logger.info(f"[SIMULATION] Creating placeholder image at {filepath}")
+        self._unlink_snapshot_target(filepath)
+        if not PIL_AVAILABLE:
+            # If PIL not available, just create empty file
+            logger.warning("PIL not available, creating empty placeholder")
+            filepath.touch()
+            return filepath
+        
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            img = Image.new('RGB', self.resolution, color=(73, 109, 137))
+            img = _get_background(tuple(self.resolution)).copy()
             d = ImageDraw.Draw(img)
             
             # Add text
-            text = f"Simulation Mode\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\nCamera not available"
+            text = f"Simulation Mode\n{time.strftime('%Y-%m-%d %H:%M:%S')}\n\nCamera not available"
             
-            # Try to use a larger font
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 36)
-            except:
-                font = ImageFont.load_default()
+            font = _get_font(36)
             
             # Calculate text position (center)
             bbox = d.textbbox((0, 0), text, font=font)
@@ -207,12 +547,7 @@ class CameraController:
             d.rectangle([10, 10, self.resolution[0]-10, self.resolution[1]-10], 
                        outline=(255, 165, 0), width=5)
             
-            img.save(filepath, quality=90)
-            return filepath
-        except ImportError:
-            # If PIL not available, just create empty file
-            logger.warning("PIL not available, creating empty placeholder")
-            filepath.touch()
+            filepath.write_bytes(_encode_jpeg(img))
             return filepath
         except Exception as e:
             logger.error(f"Failed to create simulation image: {e}")
@@ -224,27 +559,47 @@ class CameraController:
         Returns:
             Image as bytes or None if capture failed
         """
-        # For live feed, capture to temporary file and read bytes
-        import tempfile
-        
         if self.simulation_mode:
             return self._create_simulation_stream()
         
-        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
-            tmp_path = Path(tmp.name)
+        return self._submit("-", self._capture_bytes_direct).result()
+    
+    def _capture_bytes_direct(self) -> Optional[bytes]:
+        """Capture a JPEG straight to memory via rpicam-jpeg's stdout.
+        
+        Avoids a temporary file round-trip on the SD card for every frame.
+        Runs on the capture worker thread.
         
+        Returns:
+            JPEG bytes (placeholder frame if capture failed)
+        """
         try:
-            captured = self.capture_image(tmp_path)
-            if captured and captured.exists():
-                with open(captured, 'rb') as f:
-                    return f.read()
-            return None
-        finally:
-            # Clean up temp file
-            try:
-                tmp_path.unlink()
-            except:
-                pass
+            frame = self._frame_from_stream()
+            if frame is not None:
+                return frame
+            
+            command = self._build_capture_command("-")
+            
+            logger.debug("Running camera command: %s", command)
+            
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                timeout=30
+            )
+            
+            if result.returncode != 0 or not result.stdout:
+                logger.error(f"Camera capture failed: {result.stderr.decode(errors='replace')}")
+                return self._create_simulation_stream()
+            
+            return result.stdout
+            
+        except subprocess.TimeoutExpired:
+            logger.error("Camera capture timed out")
+            return self._create_simulation_stream()
+        except Exception as e:
+            logger.error(f"Error capturing image: {e}")
+            return self._create_simulation_stream()
     
     def _create_simulation_stream(self) -> Optional[bytes]:
         """Create simulation image as bytes.
@@ -252,37 +607,258 @@ class CameraController:
         Returns:
             Image bytes or None if failed
         """
+        now = int(time.time())
+        if now == _sim_cache["sec"]:
+            return _sim_cache["bytes"]
+        
+        if not PIL_AVAILABLE:
+            return None
+        
         try:
-            from PIL import Image, ImageDraw
-            import io
-            
-            img = Image.new('RGB', (640, 480), color=(73, 109, 137))
+            img = _get_background(SIMULATION_STREAM_SIZE).copy()
             d = ImageDraw.Draw(img)
-            text = f"Simulation {datetime.now().strftime('%H:%M:%S')}"
+            text = f"Simulation {time.strftime('%H:%M:%S', time.localtime(now))}"
             d.text((320, 240), text, fill=(255, 255, 255), anchor="mm")
             
-            stream = io.BytesIO()
-            img.save(stream, format='JPEG')
-            return stream.getvalue()
-        except ImportError:
+            frame = _encode_jpeg(img)
+            
+            _sim_cache["sec"] = now
+            _sim_cache["bytes"] = frame
+            return frame
+        except Exception as e:
+            logger.error(f"Failed to create simulation frame: {e}")
+            return None
+    
+    def stream_frames(self, fps: int = 2) -> Iterator[bytes]:
+        """Yield JPEG frames from the shared rpicam-vid stream.
+        
+        The camera is opened once and frames are split out of its MJPEG
+        output, instead of forking rpicam-jpeg for every frame. Concurrent
+        clients share the process (at the frame rate of the first one),
+        and still captures made meanwhile take their picture from it.
+        
+        Args:
+            fps: Frames per second to request from the camera
+            
+        Yields:
+            JPEG frame bytes
+        """
+        if self.simulation_mode:
+            while True:
+                frame = self._create_simulation_stream()
+                if not frame:
+                    return
+                yield frame
+                time.sleep(1.0 / fps)
+        
+        # Start (or join) the stream on the capture worker, so it never
+        # races a still capture for the sensor
+        key = f"stream-{next(self._stream_ids)}"
+        if not self._submit(key, self._open_stream, fps).result():
+            return
+        try:
+            with self._stream_cond:
+                seq = self._stream_seq
+            while True:
+                frame, seq = self._next_stream_frame(seq)
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            self._close_stream()
+    
+    def _build_stream_command(self, fps: int) -> list:
+        """Build the rpicam-vid command line for the MJPEG stream.
+        
+        Args:
+            fps: Frames per second to request from the camera
+            
+        Returns:
+            Command as a list of arguments
+        """
+        command = [
+            self._get_video_command(),
+            "--codec", "mjpeg",
+            "--framerate", str(fps),
+            "--width", str(self.resolution[0]),
+            "--height", str(self.resolution[1]),
+            "--inline",
+            "-n",  # No preview
+            "-t", "0",  # Run until stopped
+            "-o", "-"
+        ]
+        sensor_mode = self._get_sensor_mode()
+        if sensor_mode:
+            command.extend(["--mode", sensor_mode])
+        if self.rotation == 180:
+            command.extend(["--hflip", "--vflip"])
+        elif self.rotation in (90, 270):
+            command.extend(["--rotation", str(self.rotation)])
+        return command
+    
+    def _open_stream(self, fps: int) -> bool:
+        """Join the shared stream, starting rpicam-vid if needed (worker thread only).
+        
+        Args:
+            fps: Frames per second to request if the stream is started
+            
+        Returns:
+            True if the caller is now a stream client
+        """
+        with self._stream_cond:
+            # A stream with no clients left is shutting down; let it
+            # release the sensor before starting a new one
+            while self._stream_proc is not None and not self._stream_clients:
+                self._stream_cond.wait()
+            
+            if self._stream_proc is None:
+                command = self._build_stream_command(fps)
+                logger.debug("Starting camera stream: %s", command)
+                try:
+                    proc = subprocess.Popen(
+                        command,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        bufsize=STREAM_READ_SIZE
+                    )
+                except OSError as e:
+                    logger.error(f"Failed to start camera stream: {e}")
+                    return False
+                self._stream_proc = proc
+                self._stream_frame = None
+                threading.Thread(
+                    target=self._read_stream, args=(proc,),
+                    name="camera-stream", daemon=True
+                ).start()
+            
+            self._stream_clients += 1
+            return True
+    
+    def _close_stream(self):
+        """Leave the shared stream, stopping rpicam-vid after the last client."""
+        with self._stream_cond:
+            self._stream_clients -= 1
+            if not self._stream_clients and self._stream_proc is not None:
+                self._stream_proc.terminate()
+    
+    def _read_stream(self, proc: subprocess.Popen):
+        """Split frames out of rpicam-vid's MJPEG output and publish them.
+        
+        Args:
+            proc: Running rpicam-vid process
+        """
+        try:
+            buffer = bytearray()
+            while True:
+                chunk = proc.stdout.read1(STREAM_READ_SIZE)
+                if not chunk:
+                    break
+                buffer += chunk
+                
+                while True:
+                    start = buffer.find(JPEG_SOI)
+                    if start < 0:
+                        buffer.clear()
+                        break
+                    end = buffer.find(JPEG_EOI, start + 2)
+                    if end < 0:
+                        if start:
+                            del buffer[:start]
+                        break
+                    frame = bytes(buffer[start:end + 2])
+                    del buffer[:end + 2]
+                    with self._stream_cond:
+                        self._stream_frame = frame
+                        self._stream_seq += 1
+                        self._stream_cond.notify_all()
+        except Exception as e:
+            logger.error(f"Camera stream error: {e}")
+        finally:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            with self._stream_cond:
+                if self._stream_clients:
+                    logger.warning("Camera stream ended")
+                self._stream_proc = None
+                self._stream_frame = None
+                self._stream_cond.notify_all()
+    
+    def _next_stream_frame(self, seq: int) -> Tuple[Optional[bytes], int]:
+        """Wait for a stream frame newer than seq.
+        
+        Args:
+            seq: Sequence number of the last frame the caller has seen
+            
+        Returns:
+            (frame, its sequence number); frame is None once the stream
+            has stopped or stalled
+        """
+        with self._stream_cond:
+            self._stream_cond.wait_for(
+                lambda: self._stream_seq != seq or self._stream_proc is None,
+                timeout=STREAM_FRAME_TIMEOUT
+            )
+            if self._stream_seq == seq:
+                return None, seq
+            return self._stream_frame, self._stream_seq
+    
+    def _frame_from_stream(self) -> Optional[bytes]:
+        """Take the next frame of the running stream (worker thread only).
+        
+        If the stream is shutting down, waits for rpicam-vid to exit so
+        the caller can open the camera itself.
+        
+        Returns:
+            JPEG bytes, or None if no stream is running
+        """
+        with self._stream_cond:
+            if self._stream_proc is None:
+                return None
+            frame, _ = self._next_stream_frame(self._stream_seq)
+            if frame is not None:
+                return frame
+            self._stream_cond.wait_for(
+                lambda: self._stream_proc is None, timeout=STREAM_FRAME_TIMEOUT
+            )
+            return None
+    
+    def _snapshot_age(self) -> Optional[float]:
+        """Seconds since the latest snapshot was written, or None if missing."""
+        if not self._latest_mtime:
             return None
+        return time.time() - self._latest_mtime
+    
+    def invalidate_latest_snapshot(self):
+        """Forget the latest snapshot so the next live-feed call recaptures."""
+        self._latest_mtime = 0.0
     
     def get_latest_snapshot(self) -> Optional[Path]:
         """Get path to the latest snapshot for live feed.
         
         Returns:
-            Path to latest snapshot or None if not available
+            Path to latest snapshot or None if not available or stale
         """
-        if self.latest_snapshot_path.exists():
+        age = self._snapshot_age()
+        if age is not None and age < self.stale_after:
             return self.latest_snapshot_path
         return None
     
     def capture_for_live_feed(self) -> Optional[Path]:
         """Capture a new image for the live feed.
         
+        A snapshot written within the last ``_cache_ttl`` seconds is
+        returned as-is instead of triggering another capture.
+        
         Returns:
             Path to the captured image
         """
+        age = self._snapshot_age()
+        if age is not None and age < self._cache_ttl:
+            return self.latest_snapshot_path
         return self.capture_image(self.latest_snapshot_path)
     
     def start_preview(self):
@@ -301,13 +877,18 @@ class CameraController:
             height: Image height in pixels
         """
         self.resolution = (width, height)
+        self._sensor_mode = None
         logger.info(f"Resolution changed to {width}x{height}")
     
     def cleanup(self):
         """Clean up camera resources."""
-        # No persistent resources with subprocess approach
+        self.invalidate_latest_snapshot()
+        with self._stream_cond:
+            if self._stream_proc is not None:
+                self._stream_proc.terminate()
+        if self._worker is None:
+            return
+        if self._worker.is_alive():
+            self._queue.put(None)
+        self._worker = None
         logger.info("Camera controller cleaned up")
-    
-    def __del__(self):
-        """Destructor to ensure cleanup."""
-        self.cleanup()
@@ -4,6 +4,7 @@ Handles 9-channel relay HAT with active LOW logic:
 - GPIO.LOW = Relay energized = Device ON
 - GPIO.HIGH = Relay de-energized = Device OFF
 """
+import atexit
 import logging
 from typing import Dict, Optional
 import time
@@ -31,6 +32,7 @@ class RelayController:
         self.gpio_pins = gpio_pins or GPIO_PINS
         self.device_states: Dict[str, bool] = {}
         self.simulation_mode = not GPIO_AVAILABLE
+        self._cleaned_up = False
         
         if not self.simulation_mode:
             self._setup_gpio()
@@ -39,6 +41,9 @@ class RelayController:
             # Initialize simulated states
             for device in self.gpio_pins.keys():
                 self.device_states[device] = False
+        
+        # Safety net for exits that bypass the application shutdown path
+        atexit.register(self.cleanup)
     
     def _setup_gpio(self):
         """Setup GPIO pins for relay control."""
@@ -156,14 +161,53 @@ class RelayController:
         """
         return self.device_states.copy()
     
+    def set_states(self, states: Dict[str, bool]) -> bool:
+        """Set several devices at once with a single GPIO write.
+        
+        Args:
+            states: Dictionary mapping device names to desired states (True = ON)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        unknown = [device for device in states if device not in self.gpio_pins]
+        if unknown:
+            logger.error(f"Unknown device(s): {', '.join(unknown)}")
+            return False
+        
+        if not states:
+            return True
+        
+        try:
+            if not self.simulation_mode:
+                pins = [self.gpio_pins[device] for device in states]
+                # LOW = ON, HIGH = OFF for active LOW relay
+                levels = [GPIO.LOW if on else GPIO.HIGH for on in states.values()]
+                GPIO.output(pins, levels)
+            
+            self.device_states.update(states)
+            prefix = "[SIMULATION] " if self.simulation_mode else ""
+            logger.info(f"{prefix}Set {len(states)} devices: "
+                        + ", ".join(f"{d}={'ON' if on else 'OFF'}" for d, on in states.items()))
+            return True
+        except Exception as e:
+            logger.error(f"Error setting device states: {e}")
+            return False
+    
     def turn_all_off(self):
         """Turn off all devices (emergency/shutdown)."""
         logger.info("Turning off ALL devices")
-        for device in self.gpio_pins.keys():
-            self.turn_off(device)
+        if not self.set_states(dict.fromkeys(self.gpio_pins, False)):
+            # Fall back to per-device writes so one bad pin cannot block the rest
+            for device in self.gpio_pins.keys():
+                self.turn_off(device)
     
     def cleanup(self):
-        """Clean up GPIO resources."""
+        """Clean up GPIO resources (safe to call more than once)."""
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
+        
         logger.info("Cleaning up GPIO")
         self.turn_all_off()
         
@@ -173,7 +217,3 @@ class RelayController:
                 logger.info("GPIO cleanup complete")
             except Exception as e:
                 logger.error(f"Error during GPIO cleanup: {e}")
-    
-    def __del__(self):
-        """Destructor to ensure cleanup."""
-        self.cleanup()
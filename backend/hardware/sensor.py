@@ -2,10 +2,15 @@
 
 Reads temperature, humidity, pressure, and gas resistance from BME680 sensor via I²C.
 """
+import json
 import logging
+import os
 import time
+from datetime import datetime
+from pathlib import Path
 from typing import Dict, Optional, Tuple
-import random
+
+import numpy as np
 
 try:
     import bme680
@@ -14,10 +19,74 @@ except ImportError:
     BME680_AVAILABLE = False
     logging.warning("bme680 library not available. Running in simulation mode.")
 
-from backend.config import BME680_I2C_ADDRESS
+from backend.config import BME680_I2C_ADDRESS, DATA_DIR
 
 logger = logging.getLogger(__name__)
 
+# Simulation random walk parameters, ordered as SENSOR_KEYS
+SENSOR_KEYS = ('temperature', 'humidity', 'pressure', 'gas_resistance')
+_SIM_INIT_LO = np.array([20.0, 50.0, 1000.0, 50000.0])
+_SIM_INIT_HI = np.array([26.0, 70.0, 1020.0, 100000.0])
+_SIM_STEP = np.array([0.5, 2.0, 0.5, 1000.0])
+_SIM_MIN = np.array([15.0, 30.0, 990.0, 10000.0])
+_SIM_MAX = np.array([35.0, 90.0, 1030.0, 200000.0])
+_rng = np.random.default_rng()
+
+# Latest reading shared with other processes (tmpfs when available), so
+# readers never need to touch the I²C bus themselves
+_SHM_DIR = Path("/dev/shm")
+SHARED_READING_FILE = (_SHM_DIR if _SHM_DIR.is_dir() else DATA_DIR) / "bme680.json"
+
+
+def publish_reading(data: Dict[str, float], row_id: Optional[int] = None,
+                    project_id: Optional[int] = None) -> None:
+    """Atomically publish a sensor reading to SHARED_READING_FILE.
+    
+    The record has the same keys as a sensor_logs row, and its timestamp
+    uses the same format sqlite3 stores, so readers can use either source
+    interchangeably.
+    
+    Args:
+        data: Sensor reading as returned by BME680Sensor.read()
+        row_id: id of the most recent sensor_logs row
+        project_id: Active project the reading belongs to
+    """
+    record = {
+        'id': row_id,
+        'project_id': project_id,
+        'timestamp': datetime.now().isoformat(" "),
+        **data,
+    }
+    payload = json.dumps(record).encode()
+    tmp_path = SHARED_READING_FILE.with_name(f".{SHARED_READING_FILE.name}.{os.getpid()}")
+    try:
+        # One raw write of a few hundred bytes; no text/buffered file objects
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, SHARED_READING_FILE)
+    except OSError as e:
+        logger.warning(f"Failed to publish sensor reading: {e}")
+
+
+def read_shared_reading(max_age: float) -> Optional[Dict[str, float]]:
+    """Read the published sensor reading if it is recent enough.
+    
+    Args:
+        max_age: Maximum age of the reading in seconds
+        
+    Returns:
+        Reading keyed like a sensor_logs row, or None if missing or stale
+    """
+    try:
+        if time.time() - SHARED_READING_FILE.stat().st_mtime > max_age:
+            return None
+        return json.loads(SHARED_READING_FILE.read_bytes())
+    except (OSError, ValueError):
+        return None
+
 class BME680Sensor:
     """BME680 environmental sensor interface."""
     
@@ -32,6 +101,10 @@ class BME680Sensor:
         self.simulation_mode = not BME680_AVAILABLE
         self.last_reading: Optional[Dict[str, float]] = None
         
+        # Short-lived cache so back-to-back getters share one I²C transaction
+        self._last_read_ts = 0.0
+        self._read_ttl = 1.0
+        
         if not self.simulation_mode:
             self._init_sensor()
         else:
@@ -77,14 +150,26 @@ class BME680Sensor:
                 self.simulation_mode = True
                 logger.warning("Falling back to SIMULATION MODE")
     
-    def read(self) -> Optional[Dict[str, float]]:
+    def read(self, force: bool = False) -> Optional[Dict[str, float]]:
         """Read sensor data.
         
+        Readings younger than ``_read_ttl`` seconds are served from
+        ``last_reading`` instead of triggering another heater/I²C cycle.
+        
+        Args:
+            force: Bypass the cache and always query the sensor
+            
         Returns:
             Dictionary with keys: temperature, humidity, pressure, gas_resistance
             or None if reading failed
         """
+        now = time.monotonic()
+        if (not force and self.last_reading is not None
+                and now - self._last_read_ts < self._read_ttl):
+            return self.last_reading
+        
         if self.simulation_mode:
+            self._last_read_ts = now
             return self._simulate_reading()
         
         try:
@@ -96,10 +181,10 @@ class BME680Sensor:
                     'gas_resistance': round(self.sensor.data.gas_resistance, 2)
                 }
                 self.last_reading = data
-                logger.debug(f"Sensor reading: Temp={data['temperature']}°C, "
-                           f"Humidity={data['humidity']}%, "
-                           f"Pressure={data['pressure']}hPa, "
-                           f"Gas={data['gas_resistance']}Ω")
+                self._last_read_ts = now
+                logger.debug("Sensor reading: Temp=%s°C, Humidity=%s%%, Pressure=%shPa, Gas=%sΩ",
+                             data['temperature'], data['humidity'],
+                             data['pressure'], data['gas_resistance'])
                 return data
             else:
                 logger.warning("Failed to get sensor data")
@@ -117,29 +202,16 @@ class BME680Sensor:
         # Generate realistic values with some variation
         if self.last_reading:
             # Add small random variation to last reading
-            temp = self.last_reading['temperature'] + random.uniform(-0.5, 0.5)
-            humidity = self.last_reading['humidity'] + random.uniform(-2, 2)
-            pressure = self.last_reading['pressure'] + random.uniform(-0.5, 0.5)
-            gas = self.last_reading['gas_resistance'] + random.uniform(-1000, 1000)
+            previous = np.array([self.last_reading[key] for key in SENSOR_KEYS])
+            values = previous + _rng.uniform(-_SIM_STEP, _SIM_STEP)
         else:
             # Initial values
-            temp = random.uniform(20, 26)
-            humidity = random.uniform(50, 70)
-            pressure = random.uniform(1000, 1020)
-            gas = random.uniform(50000, 100000)
+            values = _rng.uniform(_SIM_INIT_LO, _SIM_INIT_HI)
         
         # Keep values in realistic ranges
-        temp = max(15, min(35, temp))
-        humidity = max(30, min(90, humidity))
-        pressure = max(990, min(1030, pressure))
-        gas = max(10000, min(200000, gas))
+        values = np.clip(values, _SIM_MIN, _SIM_MAX).round(2)
         
-        data = {
-            'temperature': round(temp, 2),
-            'humidity': round(humidity, 2),
-            'pressure': round(pressure, 2),
-            'gas_resistance': round(gas, 2)
-        }
+        data = dict(zip(SENSOR_KEYS, values.tolist()))
         
         self.last_reading = data
         return data
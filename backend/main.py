@@ -1,37 +1,46 @@
 """Main FastAPI application for grow tent automation system."""
 import sys
+import asyncio
+import importlib
 import logging
-import signal
-import threading
+import platform
+import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
+
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    DefaultJSONResponse = JSONResponse
+    ORJSON_AVAILABLE = False
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from backend.config import (
-    HOST, PORT, BASE_DIR, DATA_DIR,
+    HOST, PORT, CORS_ORIGINS, BASE_DIR, DEVICE_NAMES,
     get_settings, get_secrets,
     SCHEDULER_ENABLED
 )
 from backend.utils.logger import setup_logging
-from backend.automation.engine import AutomationEngine
-from backend.telegram_bot.bot import TelegramBot
-from backend.external_sync import init_sync_module, get_sync_module
-from backend.analysis.ai_analyzer import init_ai_analyzer, get_ai_analyzer
-from backend.task_scheduler import init_task_scheduler, get_task_scheduler
 from backend.database import db
 
-# Import API routers
+# Import API routers; the camera, time-lapse and plant health routers pull in
+# heavier dependencies and are mounted from the startup task instead
 from backend.api import (
-    projects, sensors, devices, settings, diary, 
-    timelapse, camera, plant_health
+    projects, sensors, devices, settings, diary
 )
 from backend.api import sync as sync_api
 from backend.api import analysis as analysis_api
@@ -41,124 +50,317 @@ from backend.api import system_settings as system_settings_api
 setup_logging()
 logger = logging.getLogger(__name__)
 
-# Global instances
-automation_engine: AutomationEngine = None
-telegram_bot: TelegramBot = None
-sync_module = None
-ai_analyzer = None
-task_scheduler = None
+# Routers imported and mounted in the background after the server is up,
+# keyed by module name with the URL prefix each one serves
+DEFERRED_ROUTERS = {
+    "backend.api.camera": "/api/camera",
+    "backend.api.timelapse": "/api/timelapse",
+    "backend.api.plant_health": "/api/plant-health",
+}
+
+# Route name of the 503 placeholders standing in for DEFERRED_ROUTERS
+DEFERRED_PLACEHOLDER = "deferred_placeholder"
+
+# Route name of the JSON 404 for unknown /api paths
+API_NOT_FOUND = "api_not_found"
+
+# Seconds shutdown waits for an unfinished startup task
+INIT_SHUTDOWN_TIMEOUT = 30
+
+# Seconds shutdown waits for the Telegram bot to stop polling
+BOT_SHUTDOWN_TIMEOUT = 5
+
+# Seconds between background rebuilds of the /api/health body
+HEALTH_REFRESH_INTERVAL = 5
+
+# Response cache TTL (seconds) for the frequently polled status endpoint
+SYSTEM_STATUS_CACHE_TTL = 1
+
+# Threads dedicated to blocking SQLite calls from request handlers
+DB_POOL_WORKERS = 4
+
+_response_cache: Dict[str, Dict[str, Any]] = {}
+_response_cache_lock = asyncio.Lock()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage application lifecycle."""
-    global automation_engine, telegram_bot, sync_module, ai_analyzer, task_scheduler
+    """Manage application lifecycle.
     
+    Subsystems are started by a background task so the server begins
+    accepting requests immediately; /health/ready reports when they are up.
+    """
     logger.info("🚀 Starting Grow Tent Automation System...")
     
-    # Load configuration
-    config = get_settings()
-    secrets = get_secrets()
+    app.state.ready = asyncio.Event()
+    app.state.automation_engine = None
+    app.state.telegram_bot = None
+    app.state.sync_module = None
+    app.state.ai_analyzer = None
+    app.state.task_scheduler = None
+    app.state.system_info_static = _static_system_info()
+    app.state.db_pool = ThreadPoolExecutor(max_workers=DB_POOL_WORKERS, thread_name_prefix="db")
+    app.state.health_payload = None
+    app.state.health_bytes = None
+    app.state.health_error = None
+    await _refresh_health(app)
+    app.state.health_task = asyncio.create_task(_health_refresh_loop(app))
+    app.state.init_task = asyncio.create_task(_deferred_init(app))
+    
+    yield
+    
+    # Shutdown
+    logger.info("🛑 Shutting down...")
+    
+    app.state.health_task.cancel()
+    
+    # Let a still-running startup finish so nothing is left half-started
+    done, _ = await asyncio.wait({app.state.init_task}, timeout=INIT_SHUTDOWN_TIMEOUT)
+    if not done:
+        logger.warning("Startup still in progress at shutdown; stopping what is running")
+    
+    resume_task = getattr(app.state, 'resume_task', None)
+    if resume_task:
+        await asyncio.wait({resume_task}, timeout=INIT_SHUTDOWN_TIMEOUT)
+    
+    state = app.state
+    if state.task_scheduler:
+        state.task_scheduler.stop()
+    
+    if state.automation_engine:
+        state.automation_engine.stop()
+    
+    # A bot stuck in a network call must not hold up process exit
+    if state.telegram_bot:
+        try:
+            await asyncio.wait_for(state.telegram_bot.stop_async(), BOT_SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Telegram bot did not stop cleanly")
+    
+    bot_task = getattr(app.state, 'bot_task', None)
+    if bot_task:
+        bot_task.cancel()
+        await asyncio.wait({bot_task}, timeout=BOT_SHUTDOWN_TIMEOUT)
+        if not bot_task.done():
+            logger.warning("Telegram bot task did not exit cleanly")
+    
+    app.state.db_pool.shutdown(wait=False)
+    
+    logger.info("👋 Shutdown complete")
+
+
+async def _deferred_init(app: FastAPI):
+    """Start all subsystems, then mark the application ready.
+    
+    Subsystems are published on ``app.state`` only once they are fully
+    started, so endpoints never see a half-initialized instance.
+    """
+    state = app.state
+    automation_engine = telegram_bot = task_scheduler = None
     
-    # Initialize automation engine
     try:
-        automation_engine = AutomationEngine()
-        automation_engine.start()
+        # Load configuration
+        config = get_settings()
+        secrets = get_secrets()
+        
+        # Hardware, sync and AI setup are independent and mostly blocking I/O,
+        # so run them concurrently on the default thread pool. One failing
+        # must not strand the others - a started engine drives the relays and
+        # has to reach app.state so shutdown can stop it.
+        results = await asyncio.gather(
+            asyncio.to_thread(_import_deferred_routers),
+            asyncio.to_thread(_init_automation_engine),
+            asyncio.to_thread(_init_sync_module, config, secrets),
+            asyncio.to_thread(_init_ai_analyzer, config, secrets),
+            return_exceptions=True,
+        )
+        routers, automation_engine, sync_module, ai_analyzer = (
+            None if isinstance(result, BaseException) else result
+            for result in results
+        )
+        if isinstance(results[0], BaseException):
+            logger.error(f"Failed to import camera/timelapse/plant health routers: {results[0]}",
+                         exc_info=results[0])
+        
+        # Publish right away so shutdown stops whatever did start
+        state.automation_engine = automation_engine
+        state.sync_module = sync_module
+        state.ai_analyzer = ai_analyzer
+        
+        if routers:
+            for module in routers.values():
+                app.include_router(module.router)
+        # Without the routers these paths should 404 rather than stay 503
+        _drop_deferred_placeholders(app)
+        if routers:
+            _move_catch_all_routes_last(app)
+            # Regenerate the OpenAPI schema with the late routes
+            app.openapi_schema = None
+        
+        # Set automation engine reference in API modules
+        if automation_engine:
+            devices.set_automation_engine(automation_engine)
+            settings.set_automation_engine(automation_engine)
+            if routers:
+                routers["backend.api.camera"].set_automation_engine(automation_engine)
+        
+        if sync_module:
+            sync_api.set_sync_module(sync_module)
+        
+        # Initialize Telegram bot as a task on this event loop
+        try:
+            from backend.telegram_bot.bot import TelegramBot
+            
+            telegram_bot = TelegramBot(automation_engine)
+            app.state.bot_task = asyncio.create_task(telegram_bot.start_async())
+            logger.info("✅ Telegram bot starting")
+        except Exception as e:
+            logger.error(f"Failed to start Telegram bot: {e}")
+            telegram_bot = None
+        state.telegram_bot = telegram_bot
+        
+        # Set module references for analysis API
+        analysis_api.set_modules(
+            ai_analyzer=ai_analyzer,
+            telegram_bot=telegram_bot,
+            sync_module=sync_module,
+            camera=automation_engine.camera if automation_engine else None
+        )
+        
+        # Initialize task scheduler
+        if SCHEDULER_ENABLED:
+            try:
+                from backend.task_scheduler import init_task_scheduler
+                
+                task_scheduler = init_task_scheduler()
+                task_scheduler.set_dependencies(
+                    ai_analyzer=ai_analyzer,
+                    sync_module=sync_module,
+                    telegram_bot=telegram_bot,
+                    camera=automation_engine.camera if automation_engine else None
+                )
+                task_scheduler.start()
+                logger.info("✅ Task scheduler started")
+            except Exception as e:
+                logger.error(f"Failed to start task scheduler: {e}")
+                task_scheduler = None
+            state.task_scheduler = task_scheduler
+        else:
+            logger.info("ℹ️ Task scheduler disabled in configuration")
+        
+        # Resume time-lapse for active projects after restart; this is only
+        # bookkeeping, so it must not hold up readiness
+        app.state.resume_task = asyncio.create_task(_resume_timelapse_captures())
+        
+        app.state.ready.set()
+        await _refresh_health(app)
+        logger.info("✅ System started successfully")
+    except Exception as e:
+        logger.error(f"Startup failed: {e}", exc_info=True)
+
+
+async def _db(fn: Callable, *args):
+    """Run a blocking database call on the DB thread pool.
+    
+    Args:
+        fn: Blocking function (usually a ``db`` method)
+        *args: Arguments for fn
+        
+    Returns:
+        Result of fn
+    """
+    pool = getattr(app.state, 'db_pool', None)
+    return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+
+
+def _import_deferred_routers() -> Dict[str, Any]:
+    """Import the routers listed in DEFERRED_ROUTERS.
+    
+    Returns:
+        Mapping of module name to imported module
+    """
+    return {name: importlib.import_module(name) for name in DEFERRED_ROUTERS}
+
+
+def _drop_deferred_placeholders(app: FastAPI):
+    """Remove the not-ready routes registered for DEFERRED_ROUTERS."""
+    app.router.routes[:] = [
+        r for r in app.router.routes if getattr(r, 'name', None) != DEFERRED_PLACEHOLDER
+    ]
+
+
+def _move_catch_all_routes_last(app: FastAPI):
+    """Keep the API 404 route and frontend mount behind routes added at runtime."""
+    routes = app.router.routes
+    for name in (API_NOT_FOUND, "frontend"):
+        route = next((r for r in routes if getattr(r, 'name', None) == name), None)
+        if route:
+            routes.remove(route)
+            routes.append(route)
+
+
+def _init_automation_engine():
+    """Create and start the automation engine.
+    
+    Returns:
+        Running AutomationEngine or None if startup failed
+    """
+    try:
+        from backend.automation.engine import AutomationEngine
+        
+        engine = AutomationEngine()
+        engine.start()
         logger.info("✅ Automation engine started")
+        return engine
     except Exception as e:
         logger.error(f"Failed to start automation engine: {e}")
-        automation_engine = None
-    
-    # Set automation engine reference in API modules
-    if automation_engine:
-        devices.set_automation_engine(automation_engine)
-        camera.set_automation_engine(automation_engine)
+        return None
+
+
+def _init_sync_module(config, secrets):
+    """Initialize the external sync module.
     
-    # Initialize external sync module
+    Returns:
+        Sync module or None if initialization failed
+    """
     try:
-        sync_module = init_sync_module(config, secrets)
-        sync_api.set_sync_module(sync_module)
-        if sync_module.enabled:
+        from backend.external_sync import init_sync_module
+        
+        module = init_sync_module(config, secrets)
+        if module.enabled:
             logger.info("✅ External sync module initialized")
         else:
             logger.info("ℹ️ External sync module disabled (not configured)")
+        return module
     except Exception as e:
         logger.error(f"Failed to initialize sync module: {e}")
-        sync_module = None
+        return None
+
+
+def _init_ai_analyzer(config, secrets):
+    """Initialize the AI analyzer.
     
-    # Initialize AI analyzer
+    Returns:
+        AI analyzer or None if initialization failed
+    """
     try:
-        ai_analyzer = init_ai_analyzer(config, secrets)
-        if ai_analyzer.enabled:
+        from backend.analysis.ai_analyzer import init_ai_analyzer
+        
+        analyzer = init_ai_analyzer(config, secrets)
+        if analyzer.enabled:
             logger.info("✅ AI analyzer initialized")
         else:
             logger.info("ℹ️ AI analyzer disabled (not configured)")
+        return analyzer
     except Exception as e:
         logger.error(f"Failed to initialize AI analyzer: {e}")
-        ai_analyzer = None
-    
-    # Initialize Telegram bot in separate thread
-    try:
-        telegram_bot = TelegramBot(automation_engine)
-        telegram_thread = threading.Thread(target=telegram_bot.start, daemon=True)
-        telegram_thread.start()
-        logger.info("✅ Telegram bot started")
-    except Exception as e:
-        logger.error(f"Failed to start Telegram bot: {e}")
-        telegram_bot = None
-    
-    # Set module references for analysis API
-    analysis_api.set_modules(
-        ai_analyzer=ai_analyzer,
-        telegram_bot=telegram_bot,
-        sync_module=sync_module,
-        camera=automation_engine.camera if automation_engine else None
-    )
-    
-    # Initialize task scheduler
-    if SCHEDULER_ENABLED:
-        try:
-            task_scheduler = init_task_scheduler()
-            task_scheduler.set_dependencies(
-                ai_analyzer=ai_analyzer,
-                sync_module=sync_module,
-                telegram_bot=telegram_bot,
-                camera=automation_engine.camera if automation_engine else None
-            )
-            task_scheduler.start()
-            logger.info("✅ Task scheduler started")
-        except Exception as e:
-            logger.error(f"Failed to start task scheduler: {e}")
-            task_scheduler = None
-    else:
-        logger.info("ℹ️ Task scheduler disabled in configuration")
-    
-    # Resume time-lapse for active projects after restart
-    _resume_timelapse_captures()
-    
-    logger.info("✅ System started successfully")
-    
-    yield
-    
-    # Shutdown
-    logger.info("🛑 Shutting down...")
-    
-    if task_scheduler:
-        task_scheduler.stop()
-    
-    if automation_engine:
-        automation_engine.stop()
-    
-    if telegram_bot:
-        telegram_bot.stop()
-    
-    logger.info("👋 Shutdown complete")
+        return None
 
 
-def _resume_timelapse_captures():
+async def _resume_timelapse_captures():
     """Resume time-lapse captures for active projects after restart."""
     try:
-        projects_needing_timelapse = db.get_projects_needing_timelapse()
+        projects_needing_timelapse = await _db(db.get_projects_needing_timelapse)
         for project in projects_needing_timelapse:
             logger.info(
                 f"Resuming time-lapse for project: {project['name']} "
@@ -174,16 +376,18 @@ app = FastAPI(
     title="Grow Tent Automation API",
     description="Production-ready Raspberry Pi grow tent automation system with AI analysis and external sync",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    # Credentials are only valid with an explicit origin list
+    allow_credentials="*" not in CORS_ORIGINS,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 # Include API routers
@@ -192,167 +396,337 @@ app.include_router(sensors.router)
 app.include_router(devices.router)
 app.include_router(settings.router)
 app.include_router(diary.router)
-app.include_router(timelapse.router)
-app.include_router(camera.router)
-app.include_router(plant_health.router)
 app.include_router(sync_api.router)
 app.include_router(analysis_api.router)
 app.include_router(system_settings_api.router)
 
+
+async def deferred_router_starting():
+    """Answer for a deferred router that has not been mounted yet."""
+    return DefaultJSONResponse(status_code=503, content={"detail": "Starting up"})
+
+
+for _prefix in DEFERRED_ROUTERS.values():
+    app.add_api_route(
+        f"{_prefix}/{{path:path}}", deferred_router_starting,
+        methods=["GET", "POST", "PUT", "DELETE"],
+        name=DEFERRED_PLACEHOLDER, include_in_schema=False,
+    )
+
 # Mount static files
+class LargeChunkStaticFiles(StaticFiles):
+    """StaticFiles that streams files in 256 KiB chunks.
+    
+    Photos and time-lapse frames are multi-megabyte; bigger reads mean far
+    fewer event-loop round-trips than Starlette's 64 KiB default. Servers
+    that support the ``http.response.pathsend`` extension still get it.
+    """
+    
+    chunk_size = 256 * 1024
+    
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        if isinstance(response, FileResponse):
+            response.chunk_size = self.chunk_size
+        return response
+
+
 frontend_dir = BASE_DIR / "frontend"
 data_dir = BASE_DIR / "data"
 
 if frontend_dir.exists():
-    app.mount("/static", StaticFiles(directory=str(frontend_dir)), name="static")
+    app.mount("/static", LargeChunkStaticFiles(directory=str(frontend_dir)), name="static")
 
 if data_dir.exists():
-    app.mount("/data", StaticFiles(directory=str(data_dir)), name="data")
+    app.mount("/data", LargeChunkStaticFiles(directory=str(data_dir)), name="data")
 
 
-# Root endpoint
-@app.get("/")
-async def root():
-    """Root endpoint - serve frontend."""
-    index_file = frontend_dir / "index.html"
-    if index_file.exists():
-        return FileResponse(index_file)
-    return {
-        "name": "Grow Tent Automation API",
-        "version": "2.0.0",
-        "status": "running",
-        "docs": "/docs"
-    }
+@app.get("/health/live")
+async def health_live():
+    """Liveness probe - the server process is accepting requests."""
+    return {"status": "alive"}
 
 
-@app.get("/api/health")
-async def health_check():
-    """Comprehensive health check endpoint."""
-    try:
-        # Check automation engine
-        automation_status = "running" if automation_engine and automation_engine.running else "stopped"
-        
-        # Check Telegram bot
-        telegram_status = "running" if telegram_bot and telegram_bot.running else "stopped"
-        
-        # Check sync module
-        sync_status = "enabled" if sync_module and sync_module.enabled else "disabled"
-        
-        # Check AI analyzer
-        ai_status = "enabled" if ai_analyzer and ai_analyzer.enabled else "disabled"
-        
-        # Check scheduler
-        scheduler_status = "running" if task_scheduler and task_scheduler.running else "stopped"
-        
-        # Get last sync status
-        last_sync = db.get_last_successful_sync('full')
+@app.get("/health/ready")
+async def health_ready(request: Request):
+    """Readiness probe - 503 until all subsystems have been started."""
+    if not request.app.state.ready.is_set():
+        return DefaultJSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ready"}
+
+
+async def _cached_json(key: str, ttl: int,
+                       build: Callable[[], Awaitable[Dict[str, Any]]]) -> DefaultJSONResponse:
+    """Serve a JSON payload from the in-process cache, rebuilding it after ttl.
+    
+    Args:
+        key: Cache key (one per endpoint)
+        ttl: Time-to-live in seconds
+        build: Coroutine function returning the fresh payload; exceptions propagate
         
-        # Get active project
-        active_project = db.get_active_project()
+    Returns:
+        JSON response with X-Cache and Cache-Control headers
+    """
+    headers = {"Cache-Control": f"max-age={ttl}"}
+    
+    entry = _response_cache.get(key)
+    if entry and time.monotonic() - entry['ts'] < ttl:
+        return DefaultJSONResponse(entry['payload'], headers={**headers, "X-Cache": "HIT"})
+    
+    async with _response_cache_lock:
+        # Another request may have refreshed it while we waited
+        entry = _response_cache.get(key)
+        if entry and time.monotonic() - entry['ts'] < ttl:
+            return DefaultJSONResponse(entry['payload'], headers={**headers, "X-Cache": "HIT"})
         
-        # Get latest sensor data
-        sensor_data = db.get_latest_sensor_data()
+        payload = jsonable_encoder(await build())
+        _response_cache[key] = {'ts': time.monotonic(), 'payload': payload}
+    
+    return DefaultJSONResponse(payload, headers={**headers, "X-Cache": "MISS"})
+
+
+def _stale_json(key: str):
+    """Serve the last good cached payload after a failed rebuild.
+    
+    Args:
+        key: Cache key used with _cached_json
         
-        return {
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "components": {
-                "automation_engine": automation_status,
-                "telegram_bot": telegram_status,
-                "external_sync": sync_status,
-                "ai_analyzer": ai_status,
-                "task_scheduler": scheduler_status
-            },
-            "data": {
-                "active_project": active_project.get('name') if active_project else None,
-                "last_sync": last_sync.get('timestamp') if last_sync else None,
-                "latest_sensor_reading": sensor_data.get('timestamp') if sensor_data else None
-            }
+    Returns:
+        JSONResponse marked stale, or None if nothing was ever cached
+    """
+    entry = _response_cache.get(key)
+    if not entry:
+        return None
+    
+    payload = entry['payload']
+    if isinstance(payload.get('data'), dict):
+        payload = {**payload, "data": {**payload['data'], "stale": True}}
+    return DefaultJSONResponse(payload, headers={
+        "X-Cache": "STALE",
+        "Warning": '110 - "Response is stale"',
+        "Cache-Control": "no-cache",
+    })
+
+
+async def _build_health_payload(state) -> Dict[str, Any]:
+    """Build the /api/health response body.
+    
+    Args:
+        state: Application state holding the subsystem instances
+    """
+    automation_engine = state.automation_engine
+    telegram_bot = state.telegram_bot
+    sync_module = state.sync_module
+    ai_analyzer = state.ai_analyzer
+    task_scheduler = state.task_scheduler
+    
+    # Check automation engine
+    automation_status = "running" if automation_engine and automation_engine.running else "stopped"
+    
+    # Check Telegram bot
+    telegram_status = "running" if telegram_bot and telegram_bot.running else "stopped"
+    
+    # Check sync module
+    sync_status = "enabled" if sync_module and sync_module.enabled else "disabled"
+    
+    # Check AI analyzer
+    ai_status = "enabled" if ai_analyzer and ai_analyzer.enabled else "disabled"
+    
+    # Check scheduler
+    scheduler_status = "running" if task_scheduler and task_scheduler.running else "stopped"
+    
+    # Latest rows in one read transaction
+    bundle = await _db(db.get_status_bundle)
+    active_project = bundle['active_project']
+    last_sync = bundle['last_sync']
+    sensor_data = bundle['sensor_data']
+    
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now(),
+        "components": {
+            "automation_engine": automation_status,
+            "telegram_bot": telegram_status,
+            "external_sync": sync_status,
+            "ai_analyzer": ai_status,
+            "task_scheduler": scheduler_status
+        },
+        "data": {
+            "active_project": active_project.get('name') if active_project else None,
+            "last_sync": last_sync.get('timestamp') if last_sync else None,
+            "latest_sensor_reading": sensor_data.get('timestamp') if sensor_data else None
         }
+    }
+
+
+async def _refresh_health(app: FastAPI):
+    """Rebuild and pre-serialize the /api/health body on app.state.
+    
+    If the rebuild fails (SQLite locked, disk full) the last good payload is
+    kept with its data marked stale, so monitoring does not restart a
+    working app over a database hiccup.
+    """
+    state = app.state
+    try:
+        payload = jsonable_encoder(await _build_health_payload(state))
     except Exception as e:
-        return JSONResponse(
+        logger.warning(f"Health refresh failed: {e}")
+        if state.health_payload is not None and state.health_error is None:
+            stale = {**state.health_payload, "data": {**state.health_payload['data'], "stale": True}}
+            state.health_bytes = DefaultJSONResponse(stale).body
+        state.health_error = str(e)
+        return
+    
+    state.health_payload = payload
+    state.health_bytes = DefaultJSONResponse(payload).body
+    state.health_error = None
+
+
+async def _health_refresh_loop(app: FastAPI):
+    """Refresh the health body every HEALTH_REFRESH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(HEALTH_REFRESH_INTERVAL)
+        await _refresh_health(app)
+
+
+@app.get("/api/health")
+async def health_check(request: Request):
+    """Comprehensive health check endpoint (refreshed in the background)."""
+    state = request.app.state
+    body = state.health_bytes
+    if body is None:
+        return DefaultJSONResponse(
             status_code=500,
-            content={"status": "unhealthy", "error": str(e)}
+            content={"status": "unhealthy", "error": state.health_error}
         )
+    
+    headers = {"Cache-Control": f"max-age={HEALTH_REFRESH_INTERVAL}"}
+    if state.health_error:
+        headers.update({"X-Cache": "STALE", "Warning": '110 - "Response is stale"'})
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _static_system_info() -> Dict[str, Any]:
+    """Compute the parts of /api/system/info that never change at runtime."""
+    return {
+        "platform": platform.system(),
+        "python_version": platform.python_version(),
+        "api_version": "2.0.0",
+        "devices": DEVICE_NAMES,
+    }
+
+
+def _build_system_info_payload(state) -> Dict[str, Any]:
+    """Build the /api/system/info response body.
+    
+    Only the static part is precomputed; the subsystem flags are read
+    live, since they change as deferred startup brings subsystems up.
+    
+    Args:
+        state: Application state holding the subsystem instances
+    """
+    return {
+        "success": True,
+        "data": {
+            **state.system_info_static,
+            "automation_running": state.automation_engine.running if state.automation_engine else False,
+            "telegram_enabled": state.telegram_bot is not None and state.telegram_bot.running,
+            "external_sync_enabled": state.sync_module.enabled if state.sync_module else False,
+            "ai_analysis_enabled": state.ai_analyzer.enabled if state.ai_analyzer else False,
+            "scheduler_enabled": state.task_scheduler is not None and state.task_scheduler.running
+        }
+    }
 
 
 @app.get("/api/system/info")
-async def system_info():
+async def system_info(request: Request):
     """Get system information."""
     try:
-        import platform
-        from backend.config import GPIO_PINS
-        
-        return {
-            "success": True,
-            "data": {
-                "platform": platform.system(),
-                "python_version": platform.python_version(),
-                "api_version": "2.0.0",
-                "devices": list(GPIO_PINS.keys()),
-                "automation_running": automation_engine.running if automation_engine else False,
-                "telegram_enabled": telegram_bot is not None and telegram_bot.running,
-                "external_sync_enabled": sync_module.enabled if sync_module else False,
-                "ai_analysis_enabled": ai_analyzer.enabled if ai_analyzer else False,
-                "scheduler_enabled": task_scheduler is not None and task_scheduler.running
-            }
-        }
+        return _build_system_info_payload(request.app.state)
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+async def _build_system_status_payload(state) -> Dict[str, Any]:
+    """Build the /api/system/status response body.
+    
+    Args:
+        state: Application state holding the subsystem instances
+    """
+    task_scheduler = state.task_scheduler
+    
+    # Latest rows (with the project's timelapse count) in one transaction
+    bundle = await _db(db.get_status_bundle)
+    active_project = bundle['active_project']
+    sensor_data = bundle['sensor_data']
+    latest_analysis = bundle['latest_analysis']
+    last_sync = bundle['last_sync']
+    
+    # Get scheduled tasks status
+    scheduled_tasks = []
+    if task_scheduler:
+        scheduled_tasks = await _db(task_scheduler.get_task_status)
+    
+    return {
+        "success": True,
+        "data": {
+            "active_project": active_project,
+            "sensor_data": sensor_data,
+            "latest_analysis": {
+                "timestamp": latest_analysis.get('timestamp') if latest_analysis else None,
+                "health_score": latest_analysis.get('health_score') if latest_analysis else None
+            } if latest_analysis else None,
+            "last_sync": {
+                "timestamp": last_sync.get('timestamp') if last_sync else None,
+                "items_synced": last_sync.get('items_synced') if last_sync else 0
+            } if last_sync else None,
+            "scheduled_tasks": scheduled_tasks
+        }
+    }
+
+
 @app.get("/api/system/status")
-async def system_status():
-    """Get detailed system status."""
+async def system_status(request: Request):
+    """Get detailed system status (cached for SYSTEM_STATUS_CACHE_TTL).
+    
+    The short cache lets clients polling at the same time share one
+    database read.
+    """
     try:
-        # Get active project with timelapse info
-        active_project = db.get_active_project()
-        if active_project:
-            active_project['timelapse_count'] = db.get_timelapse_image_count(active_project['id'])
-        
-        # Get latest sensor data
-        sensor_data = db.get_latest_sensor_data()
-        
-        # Get latest AI analysis
-        latest_analysis = db.get_latest_ai_analysis()
-        
-        # Get scheduled tasks status
-        scheduled_tasks = []
-        if task_scheduler:
-            scheduled_tasks = task_scheduler.get_task_status()
-        
-        # Get sync status
-        last_sync = db.get_last_successful_sync('full')
-        
-        return {
-            "success": True,
-            "data": {
-                "active_project": active_project,
-                "sensor_data": sensor_data,
-                "latest_analysis": {
-                    "timestamp": latest_analysis.get('timestamp') if latest_analysis else None,
-                    "health_score": latest_analysis.get('health_score') if latest_analysis else None
-                } if latest_analysis else None,
-                "last_sync": {
-                    "timestamp": last_sync.get('timestamp') if last_sync else None,
-                    "items_synced": last_sync.get('items_synced') if last_sync else 0
-                } if last_sync else None,
-                "scheduled_tasks": scheduled_tasks
-            }
-        }
+        return await _cached_json(
+            "system_status", SYSTEM_STATUS_CACHE_TTL,
+            partial(_build_system_status_payload, request.app.state)
+        )
     except Exception as e:
+        stale = _stale_json("system_status")
+        if stale:
+            return stale
         return {"success": False, "error": str(e)}
 
 
-# Signal handlers for graceful shutdown
-def signal_handler(sig, frame):
-    """Handle shutdown signals."""
-    logger.info(f"Received signal {sig}, shutting down...")
-    sys.exit(0)
+@app.api_route(
+    "/api/{path:path}", methods=["GET", "POST", "PUT", "DELETE"],
+    name=API_NOT_FOUND, include_in_schema=False,
+)
+async def api_not_found(path: str):
+    """Unknown API paths get a JSON 404 instead of the frontend's plain-text one."""
+    raise HTTPException(status_code=404, detail="Not Found")
 
 
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
+# Root endpoint - serve the frontend. Mounted last because "/" matches every
+# path; API routes registered above take precedence.
+if (frontend_dir / "index.html").exists():
+    app.mount("/", LargeChunkStaticFiles(directory=str(frontend_dir), html=True), name="frontend")
+else:
+    @app.get("/")
+    async def root():
+        """Root endpoint - no frontend installed."""
+        return {
+            "name": "Grow Tent Automation API",
+            "version": "2.0.0",
+            "status": "running",
+            "docs": "/docs"
+        }
 
 
 if __name__ == "__main__":
@@ -362,10 +736,14 @@ if __name__ == "__main__":
     logger.info(f"Web UI: http://{HOST}:{PORT}")
     logger.info(f"API Docs: http://{HOST}:{PORT}/docs")
     
+    # uvicorn handles SIGINT/SIGTERM and runs the lifespan shutdown, so
+    # hardware, bot and scheduler are always stopped cleanly.
+    # A single process: GPIO, sensor and camera state live in this worker.
     uvicorn.run(
         "main:app",
         host=HOST,
         port=PORT,
+        backlog=128,
         reload=False,
         log_level="info"
     )
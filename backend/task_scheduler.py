@@ -5,33 +5,82 @@ Uses APScheduler for scheduled tasks including:
 - Periodic external server sync
 - Daily report generation
 - Time-lapse capture management
+
+The scheduler runs on the application's asyncio event loop. Coroutine
+tasks run on the loop itself; blocking tasks run on thread pools.
 """
+import asyncio
+import hashlib
+import json
 import logging
+import os
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Optional, Dict, Any, Callable, List
 from pathlib import Path
+from uuid import uuid4
 
 try:
-    from apscheduler.schedulers.background import BackgroundScheduler
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
     from apscheduler.triggers.cron import CronTrigger
     from apscheduler.triggers.interval import IntervalTrigger
-    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+    from apscheduler.jobstores.memory import MemoryJobStore
     from apscheduler.executors.pool import ThreadPoolExecutor
+    from apscheduler.executors.asyncio import AsyncIOExecutor
+    from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
     APSCHEDULER_AVAILABLE = True
 except ImportError:
     APSCHEDULER_AVAILABLE = False
-    BackgroundScheduler = None
+    AsyncIOScheduler = None
 
 from backend.config import (
-    BASE_DIR, DATA_DIR, DATABASE_PATH,
+    BASE_DIR, DATA_DIR,
     get_settings, get_secrets,
     AI_ANALYSIS_SCHEDULE_TIME, EXTERNAL_SYNC_INTERVAL,
     DAILY_REPORT_TIME, SCHEDULER_ENABLED
 )
 from backend.database import db
+from backend.utils.files import latest_photo
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for the scheduler's executors
+SCHEDULER_WORKERS = 3
+SCHEDULER_IO_WORKERS = 2
+
+# Daily report emoji
+EMOJI_CHART = "\U0001f4ca"
+EMOJI_PLANT = "\U0001f33f"
+EMOJI_THERMOMETER = "\U0001f321"
+EMOJI_DROPLET = "\U0001f4a7"
+EMOJI_CAMERA = "\U0001f4f7"
+EMOJI_ROBOT = "\U0001f916"
+
+# Trigger instances by (type, *args); triggers are immutable, so jobs
+# re-registered with the same schedule share one instance
+_trigger_cache: Dict[tuple, Any] = {}
+
+# Seconds a worker thread waits for a Telegram message to be sent
+TELEGRAM_SEND_TIMEOUT = 30
+
+
+def _cron_trigger(hour: int, minute: int):
+    """Get a shared daily CronTrigger for hour:minute."""
+    key = ('cron', hour, minute)
+    trigger = _trigger_cache.get(key)
+    if trigger is None:
+        trigger = _trigger_cache[key] = CronTrigger(hour=hour, minute=minute)
+    return trigger
+
+
+def _interval_trigger(seconds: int):
+    """Get a shared IntervalTrigger for the given period."""
+    key = ('interval', seconds)
+    trigger = _trigger_cache.get(key)
+    if trigger is None:
+        trigger = _trigger_cache[key] = IntervalTrigger(seconds=seconds)
+    return trigger
+
 
 class TaskSchedulerError(Exception):
     """Custom exception for task scheduler errors."""
@@ -43,19 +92,32 @@ class TaskScheduler:
     
     def __init__(self):
         """Initialize the task scheduler."""
-        self.scheduler: Optional[BackgroundScheduler] = None
+        self.scheduler: Optional[AsyncIOScheduler] = None
         self.running = False
         self._tasks_registered = False
         
+        # Digest of the settings the default tasks were last registered from
+        self._last_settings_hash: Optional[bytes] = None
+        
+        # scheduled_tasks rows waiting to be written in one batch
+        self._pending_task_rows: List[tuple] = []
+        
         # Store references to task functions
         self._task_functions: Dict[str, Callable] = {}
         
+        # last_run/run_count per task, mirrored from scheduled_tasks so
+        # status polling does not query the database
+        self._task_meta: Dict[str, Dict[str, Any]] = {}
+        
         # External references (set later)
         self._ai_analyzer = None
         self._sync_module = None
         self._telegram_bot = None
         self._camera = None
         
+        # Where analysis photos are written and the sync looks for photos
+        self._photos_dir = str(DATA_DIR / "photos")
+        
         if not APSCHEDULER_AVAILABLE:
             logger.warning("APScheduler not installed. Scheduled tasks disabled.")
             return
@@ -72,16 +134,20 @@ class TaskScheduler:
             return
         
         try:
-            # Configure job stores - use SQLite for persistence
+            # Jobs are re-registered from settings on every start and their
+            # metadata lives in the scheduled_tasks table, so an in-memory
+            # store is enough and avoids SQLAlchemy on every job lookup
             jobstores = {
-                'default': SQLAlchemyJobStore(
-                    url=f'sqlite:///{DATABASE_PATH}'
-                )
+                'default': MemoryJobStore()
             }
             
-            # Configure executors
+            # Configure executors - a handful of coarse jobs with
+            # max_instances=1; network sync gets its own pool so a slow
+            # server cannot delay reports or analysis
             executors = {
-                'default': ThreadPoolExecutor(10)
+                'default': ThreadPoolExecutor(SCHEDULER_WORKERS),
+                'io': ThreadPoolExecutor(SCHEDULER_IO_WORKERS),
+                'asyncio': AsyncIOExecutor()
             }
             
             # Job defaults
@@ -91,13 +157,18 @@ class TaskScheduler:
                 'misfire_grace_time': 300  # 5 minutes grace for missed jobs
             }
             
-            self.scheduler = BackgroundScheduler(
+            self.scheduler = AsyncIOScheduler(
                 jobstores=jobstores,
                 executors=executors,
                 job_defaults=job_defaults,
                 timezone='UTC'
             )
             
+            # Record every run in one place, whatever executor ran it
+            self.scheduler.add_listener(
+                self._on_job_event, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
+            )
+            
             logger.info("Task scheduler initialized")
             
         except Exception as e:
@@ -119,8 +190,20 @@ class TaskScheduler:
         self._telegram_bot = telegram_bot
         self._camera = camera
     
+    def _executor_for(self, func: Callable, executor: str) -> str:
+        """Run coroutine functions on the event loop, others on a thread pool."""
+        return 'asyncio' if asyncio.iscoroutinefunction(func) else executor
+    
+    def _send_telegram(self, message: str):
+        """Send a Telegram message from a worker thread."""
+        if self._telegram_bot:
+            self._telegram_bot.send_message_threadsafe(message, TELEGRAM_SEND_TIMEOUT)
+    
     def start(self):
-        """Start the task scheduler."""
+        """Start the task scheduler.
+        
+        Must be called from the thread running the application event loop.
+        """
         if not self.scheduler:
             logger.warning("Scheduler not available")
             return False
@@ -156,9 +239,22 @@ class TaskScheduler:
             logger.error(f"Error stopping scheduler: {e}")
     
     def _register_default_tasks(self):
-        """Register default scheduled tasks."""
+        """Register default scheduled tasks.
+        
+        Their database rows are written together once all are added.
+        Nothing is done if the relevant settings are unchanged since the
+        last registration.
+        """
         settings = get_settings()
         
+        relevant = {key: settings.get(key, {}) for key in ('ai_analysis', 'external_sync', 'scheduler')}
+        settings_hash = hashlib.blake2b(
+            json.dumps(relevant, sort_keys=True, default=str).encode()
+        ).digest()
+        if settings_hash == self._last_settings_hash:
+            logger.debug("Task settings unchanged, skipping registration")
+            return
+        
         # Daily AI analysis task
         ai_config = settings.get('ai_analysis', {})
         if ai_config.get('enabled', False):
@@ -167,8 +263,11 @@ class TaskScheduler:
                 'daily_ai_analysis',
                 self._run_daily_ai_analysis,
                 schedule_time,
-                "Daily AI Photo Analysis"
+                "Daily AI Photo Analysis",
+                defer_persist=True
             )
+        else:
+            self._drop_task('daily_ai_analysis')
         
         # External sync task
         sync_config = settings.get('external_sync', {})
@@ -178,8 +277,12 @@ class TaskScheduler:
                 'external_sync',
                 self._run_external_sync,
                 interval,
-                "External Server Sync"
+                "External Server Sync",
+                defer_persist=True,
+                executor='io'
             )
+        else:
+            self._drop_task('external_sync')
         
         # Daily report task
         scheduler_config = settings.get('scheduler', {})
@@ -188,14 +291,45 @@ class TaskScheduler:
             'daily_report',
             self._run_daily_report,
             report_time,
-            "Daily Report Generation"
+            "Daily Report Generation",
+            defer_persist=True
         )
         
+        self._flush_pending_tasks()
+        self._last_settings_hash = settings_hash
         self._tasks_registered = True
         logger.info("Default tasks registered")
     
+    def _drop_task(self, task_id: str):
+        """Unschedule a default task that has been disabled, if it is scheduled."""
+        if self.scheduler.get_job(task_id):
+            self.remove_task(task_id)
+    
+    def _persist_task(self, row: tuple, defer: bool):
+        """Save a scheduled_tasks row now, or queue it for _flush_pending_tasks."""
+        # The row replaces any previous one, resetting its run history
+        self._task_meta[row[0]] = {'last_run': None, 'run_count': 0}
+        if defer:
+            self._pending_task_rows.append(row)
+        else:
+            db.save_scheduled_task(*row)
+    
+    def _flush_pending_tasks(self):
+        """Write all queued scheduled_tasks rows in one transaction."""
+        rows, self._pending_task_rows = self._pending_task_rows, []
+        try:
+            db.save_scheduled_tasks_bulk(rows)
+        except Exception as e:
+            logger.error(f"Failed to save scheduled tasks: {e}")
+    
+    def reload_tasks(self):
+        """Re-register default tasks after a configuration reload."""
+        if self.scheduler:
+            self._register_default_tasks()
+    
     def add_daily_task(self, task_id: str, func: Callable, 
-                       time_str: str, description: str = "") -> bool:
+                       time_str: str, description: str = "",
+                       defer_persist: bool = False) -> bool:
         """Add a daily scheduled task.
         
         Args:
@@ -203,6 +337,7 @@ class TaskScheduler:
             func: Function to execute
             time_str: Time to run (HH:MM format)
             description: Task description
+            defer_persist: Queue the database row for a batched write
             
         Returns:
             True if successful
@@ -215,18 +350,19 @@ class TaskScheduler:
             
             self.scheduler.add_job(
                 func,
-                CronTrigger(hour=hour, minute=minute),
+                _cron_trigger(hour, minute),
                 id=task_id,
                 name=description or task_id,
+                executor=self._executor_for(func, 'default'),
                 replace_existing=True
             )
             
             self._task_functions[task_id] = func
             
             # Save to database for UI display
-            db.save_scheduled_task(
-                task_id, description or task_id,
-                'daily', time_str, True
+            self._persist_task(
+                (task_id, description or task_id, 'daily', time_str, True),
+                defer_persist
             )
             
             logger.info(f"Added daily task: {task_id} at {time_str}")
@@ -237,7 +373,9 @@ class TaskScheduler:
             return False
     
     def add_interval_task(self, task_id: str, func: Callable,
-                          interval_seconds: int, description: str = "") -> bool:
+                          interval_seconds: int, description: str = "",
+                          defer_persist: bool = False,
+                          executor: str = 'default') -> bool:
         """Add an interval-based scheduled task.
         
         Args:
@@ -245,6 +383,8 @@ class TaskScheduler:
             func: Function to execute
             interval_seconds: Interval between executions
             description: Task description
+            defer_persist: Queue the database row for a batched write
+            executor: Scheduler executor to run on ('default' or 'io')
             
         Returns:
             True if successful
@@ -255,18 +395,19 @@ class TaskScheduler:
         try:
             self.scheduler.add_job(
                 func,
-                IntervalTrigger(seconds=interval_seconds),
+                _interval_trigger(interval_seconds),
                 id=task_id,
                 name=description or task_id,
+                executor=self._executor_for(func, executor),
                 replace_existing=True
             )
             
             self._task_functions[task_id] = func
             
             # Save to database
-            db.save_scheduled_task(
-                task_id, description or task_id,
-                'interval', str(interval_seconds), True
+            self._persist_task(
+                (task_id, description or task_id, 'interval', str(interval_seconds), True),
+                defer_persist
             )
             
             logger.info(f"Added interval task: {task_id} every {interval_seconds}s")
@@ -326,28 +467,93 @@ class TaskScheduler:
             return False
     
     def run_task_now(self, task_id: str) -> bool:
-        """Run a task immediately.
+        """Start a task immediately in the background.
+        
+        The run is submitted as a one-off job on the same executor as the
+        scheduled task, so the caller (usually a request handler) does not
+        wait for it. _on_job_event records the run when it completes.
         
         Args:
             task_id: Task identifier
             
         Returns:
-            True if successful
+            True if the run was submitted (False if the scheduler is not
+            running, since the job would never be picked up)
         """
-        if task_id in self._task_functions:
+        if not self.running:
+            logger.warning(f"Scheduler not running, cannot start task: {task_id}")
+            return False
+        
+        if task_id in self._task_functions and self.scheduler:
             try:
                 func = self._task_functions[task_id]
-                func()
-                db.update_task_run_time(task_id)
-                logger.info(f"Manually executed task: {task_id}")
+                job = self.scheduler.get_job(task_id)
+                self.scheduler.add_job(
+                    func,
+                    'date',
+                    id=f"{task_id}_manual_{uuid4().hex[:6]}",
+                    name=f"{job.name if job else task_id} (manual)",
+                    executor=job.executor if job else self._executor_for(func, 'default')
+                )
+                logger.info(f"Manually started task: {task_id}")
                 return True
             except Exception as e:
-                logger.error(f"Error executing task {task_id}: {e}")
+                logger.error(f"Error starting task {task_id}: {e}")
                 return False
         
         logger.warning(f"Task not found: {task_id}")
         return False
     
+    def _on_job_event(self, event):
+        """Record a finished job run (scheduler listener).
+        
+        Only runs that returned normally count; task bodies let their
+        errors propagate so a failed run arrives here as EVENT_JOB_ERROR.
+        Called on the thread that ran the job, which for coroutine jobs is
+        the event loop, so the database write is moved off it there.
+        """
+        task_id = event.job_id.split('_manual_', 1)[0]
+        if event.exception:
+            logger.error(f"Task {task_id} failed: {event.exception}")
+            return
+        
+        # Scheduled start time (UTC) as local time, like other timestamps
+        ran_at = event.scheduled_run_time.astimezone().replace(tzinfo=None)
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        try:
+            if loop:
+                future = loop.run_in_executor(None, self._record_run, task_id, ran_at)
+                future.add_done_callback(partial(self._on_record_done, task_id))
+            else:
+                self._record_run(task_id, ran_at)
+        except Exception as e:
+            logger.error(f"Failed to record run of {task_id}: {e}")
+    
+    @staticmethod
+    def _on_record_done(task_id: str, future: "asyncio.Future"):
+        """Log a failed _record_run that ran on the executor."""
+        if not future.cancelled() and future.exception():
+            logger.error(f"Failed to record run of {task_id}: {future.exception()}")
+    
+    def _record_run(self, task_id: str, ran_at: Optional[datetime] = None):
+        """Record a completed run in the database and the in-memory mirror.
+        
+        Args:
+            task_id: Task identifier
+            ran_at: Time the run started (defaults to now)
+        """
+        ran_at = ran_at or datetime.now()
+        db.update_task_run_time(task_id, last_run=ran_at)
+        meta = self._task_meta.get(task_id)
+        if meta is not None:
+            meta['last_run'] = str(ran_at)
+            meta['run_count'] += 1
+    
     def get_task_status(self) -> List[Dict[str, Any]]:
         """Get status of all scheduled tasks.
         
@@ -366,11 +572,18 @@ class TaskScheduler:
                     'paused': job.next_run_time is None
                 }
                 
-                # Get additional info from database
-                db_task = db.get_scheduled_task(job.id)
-                if db_task:
-                    task_info['last_run'] = db_task.get('last_run')
-                    task_info['run_count'] = db_task.get('run_count', 0)
+                # Run history, from the database only on a cache miss
+                meta = self._task_meta.get(job.id)
+                if meta is None:
+                    db_task = db.get_scheduled_task(job.id)
+                    if db_task:
+                        meta = self._task_meta[job.id] = {
+                            'last_run': db_task.get('last_run'),
+                            'run_count': db_task.get('run_count', 0)
+                        }
+                if meta:
+                    task_info['last_run'] = meta['last_run']
+                    task_info['run_count'] = meta['run_count']
                 
                 tasks.append(task_info)
         
@@ -381,78 +594,73 @@ class TaskScheduler:
     # ========================================================================
     
     def _run_daily_ai_analysis(self):
-        """Execute daily AI photo analysis task."""
+        """Execute daily AI photo analysis task.
+        
+        Errors propagate to the scheduler, so a failed run is not
+        recorded as completed.
+        """
         logger.info("Running daily AI analysis task")
+        now = datetime.now()
         
-        try:
-            # Get active project
-            project = db.get_active_project()
-            if not project:
-                logger.info("No active project for AI analysis")
-                return
+        # Get active project
+        project = db.get_active_project()
+        if not project:
+            logger.info("No active project for AI analysis")
+            return
+        
+        # Capture photo if camera available
+        photo_path = None
+        if self._camera:
+            try:
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
+                photo_path = os.path.join(self._photos_dir, f"analysis_{timestamp}.jpg")
+                if not self._camera.capture_image(photo_path):
+                    raise RuntimeError("camera returned no image")
+                logger.info(f"Captured photo for analysis: {photo_path}")
+            except Exception as e:
+                logger.error(f"Failed to capture photo: {e}")
+                photo_path = None
+                # Try to use latest timelapse image instead
+                images = db.get_timelapse_images(project['id'])
+                if images:
+                    photo_path = images[-1]['filepath']
+        
+        if not photo_path:
+            logger.warning("No photo available for analysis")
+            return
+        
+        # Run AI analysis
+        if self._ai_analyzer and self._ai_analyzer.enabled:
+            result = self._ai_analyzer.analyze_photo(str(photo_path))
             
-            # Capture photo if camera available
-            photo_path = None
-            if self._camera:
-                try:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    photo_dir = DATA_DIR / "photos"
-                    photo_path = photo_dir / f"analysis_{timestamp}.jpg"
-                    self._camera.capture_photo(str(photo_path))
-                    logger.info(f"Captured photo for analysis: {photo_path}")
-                except Exception as e:
-                    logger.error(f"Failed to capture photo: {e}")
-                    # Try to use latest timelapse image instead
-                    images = db.get_timelapse_images(project['id'])
-                    if images:
-                        photo_path = images[-1]['filepath']
-            
-            if not photo_path:
-                logger.warning("No photo available for analysis")
-                return
+            # Save to database
+            analysis_id = db.save_ai_analysis(
+                project_id=project['id'],
+                photo_path=str(photo_path),
+                analysis_text=result.get('analysis_text', ''),
+                health_score=result.get('health_score'),
+                recommendations=result.get('recommendations', ''),
+                model=result.get('model', ''),
+                tokens_used=result.get('tokens_used')
+            )
             
-            # Run AI analysis
-            if self._ai_analyzer and self._ai_analyzer.enabled:
-                try:
-                    result = self._ai_analyzer.analyze_photo(str(photo_path))
-                    
-                    # Save to database
-                    analysis_id = db.save_ai_analysis(
-                        project_id=project['id'],
-                        photo_path=str(photo_path),
-                        analysis_text=result.get('analysis_text', ''),
-                        health_score=result.get('health_score'),
-                        recommendations=result.get('recommendations', ''),
-                        model=result.get('model', ''),
-                        tokens_used=result.get('tokens_used')
-                    )
-                    
-                    logger.info(f"AI analysis saved: ID {analysis_id}")
-                    
-                    # Send to Telegram if configured
-                    if self._telegram_bot and self._ai_analyzer.send_to_telegram:
-                        message = self._ai_analyzer.format_telegram_message(
-                            result, project.get('name', '')
-                        )
-                        self._telegram_bot.send_message(message)
-                    
-                    # Sync to external server if configured
-                    if self._sync_module and self._ai_analyzer.send_to_external:
-                        analysis_data = db.get_ai_analysis(analysis_id)
-                        if analysis_data:
-                            self._sync_module.sync_analysis_report(analysis_data)
-                            db.mark_analysis_synced(analysis_id)
-                    
-                    # Update task run time
-                    db.update_task_run_time('daily_ai_analysis')
-                    
-                except Exception as e:
-                    logger.error(f"AI analysis failed: {e}")
-            else:
-                logger.info("AI analyzer not available or not enabled")
-                
-        except Exception as e:
-            logger.error(f"Daily AI analysis task error: {e}")
+            logger.info(f"AI analysis saved: ID {analysis_id}")
+            
+            # Send to Telegram if configured
+            if self._telegram_bot and self._ai_analyzer.send_to_telegram:
+                message = self._ai_analyzer.format_telegram_message(
+                    result, project.get('name', '')
+                )
+                self._send_telegram(message)
+            
+            # Sync to external server if configured
+            if self._sync_module and self._ai_analyzer.send_to_external:
+                analysis_data = db.get_ai_analysis(analysis_id)
+                if analysis_data:
+                    self._sync_module.sync_analysis_report(analysis_data)
+                    db.mark_analysis_synced(analysis_id)
+        else:
+            logger.info("AI analyzer not available or not enabled")
     
     def _run_external_sync(self):
         """Execute external server sync task."""
@@ -470,11 +678,8 @@ class TaskScheduler:
             
             # Get latest photo path
             photo_path = None
-            photos_dir = DATA_DIR / "photos"
-            if photos_dir.exists():
-                photos = sorted(photos_dir.glob("*.jpg"))
-                if photos:
-                    photo_path = str(photos[-1])
+            if os.path.isdir(self._photos_dir):
+                photo_path = latest_photo(self._photos_dir)
             
             # Run sync
             result = self._sync_module.sync_all(
@@ -492,77 +697,93 @@ class TaskScheduler:
                 items_synced=result.get('synced', 0)
             )
             
-            db.update_task_run_time('external_sync')
-            
             logger.info(f"External sync completed: {result.get('synced')}/{result.get('total')} items")
             
         except Exception as e:
-            logger.error(f"External sync task error: {e}")
             db.log_sync(
                 sync_type='full',
                 status='error',
                 error_message=str(e)
             )
+            # Let the scheduler record the run as failed
+            raise
     
-    def _run_daily_report(self):
-        """Execute daily report generation task."""
+    async def _run_daily_report(self):
+        """Execute daily report generation task.
+        
+        Runs on the event loop: database work goes to a thread, and the
+        Telegram send is awaited directly on the bot's loop. Errors
+        propagate to the scheduler, like the other tasks.
+        """
         logger.info("Running daily report task")
+        now = datetime.now()
         
-        try:
-            project = db.get_active_project()
-            if not project:
-                logger.info("No active project for daily report")
-                return
+        report = await asyncio.to_thread(self._build_daily_report, now)
+        if report is None:
+            return
+        
+        # Send to Telegram
+        if self._telegram_bot:
+            await self._telegram_bot.send_message(report)
+        
+        logger.info("Daily report sent")
+    
+    def _build_daily_report(self, now: datetime) -> Optional[str]:
+        """Build the daily report text from the database.
+        
+        Args:
+            now: Time the report run started; its day is reported
             
-            # Get today's sensor data
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            sensor_data = db.get_sensor_data(
-                project_id=project['id'],
-                start_date=today,
-                limit=1000
+        Returns:
+            Report in Telegram Markdown, or None if there is nothing to report
+        """
+        project = db.get_active_project()
+        if not project:
+            logger.info("No active project for daily report")
+            return None
+        
+        # Get today's sensor data
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        stats = db.get_sensor_aggregates(
+            project_id=project['id'],
+            start_date=today
+        )
+        
+        if not stats['n']:
+            logger.info("No sensor data for today")
+            return None
+        
+        parts = [
+            f"{EMOJI_CHART} *Daily Report - {now:%Y-%m-%d}*\n\n",
+            f"{EMOJI_PLANT} *Project:* {project.get('name', 'Unknown')}\n\n",
+        ]
+        
+        if stats['t_avg'] is not None:
+            parts.append(
+                f"{EMOJI_THERMOMETER} *Temperature:*\n"
+                f"  Min: {stats['t_min']:.1f}°C\n"
+                f"  Max: {stats['t_max']:.1f}°C\n"
+                f"  Avg: {stats['t_avg']:.1f}°C\n\n"
             )
-            
-            if not sensor_data:
-                logger.info("No sensor data for today")
-                return
-            
-            # Calculate statistics
-            temps = [d['temperature'] for d in sensor_data if d.get('temperature')]
-            humidities = [d['humidity'] for d in sensor_data if d.get('humidity')]
-            
-            report = f"\ud83d\udcca *Daily Report - {datetime.now().strftime('%Y-%m-%d')}*\n\n"
-            report += f"\ud83c\udf3f *Project:* {project.get('name', 'Unknown')}\n\n"
-            
-            if temps:
-                report += f"\ud83c\udf21 *Temperature:*\n"
-                report += f"  Min: {min(temps):.1f}°C\n"
-                report += f"  Max: {max(temps):.1f}°C\n"
-                report += f"  Avg: {sum(temps)/len(temps):.1f}°C\n\n"
-            
-            if humidities:
-                report += f"\ud83d\udca7 *Humidity:*\n"
-                report += f"  Min: {min(humidities):.1f}%\n"
-                report += f"  Max: {max(humidities):.1f}%\n"
-                report += f"  Avg: {sum(humidities)/len(humidities):.1f}%\n\n"
-            
-            # Get timelapse count
-            timelapse_count = db.get_timelapse_image_count(project['id'])
-            report += f"\ud83d\udcf7 *Time-lapse Images:* {timelapse_count}\n"
-            
-            # Get latest AI analysis
-            analysis = db.get_latest_ai_analysis(project['id'])
-            if analysis:
-                report += f"\n\ud83e\udd16 *Latest AI Health Score:* {analysis.get('health_score', 'N/A')}/10\n"
-            
-            # Send to Telegram
-            if self._telegram_bot:
-                self._telegram_bot.send_message(report)
-            
-            db.update_task_run_time('daily_report')
-            logger.info("Daily report sent")
-            
-        except Exception as e:
-            logger.error(f"Daily report task error: {e}")
+        
+        if stats['h_avg'] is not None:
+            parts.append(
+                f"{EMOJI_DROPLET} *Humidity:*\n"
+                f"  Min: {stats['h_min']:.1f}%\n"
+                f"  Max: {stats['h_max']:.1f}%\n"
+                f"  Avg: {stats['h_avg']:.1f}%\n\n"
+            )
+        
+        # Get timelapse count
+        timelapse_count = db.get_timelapse_image_count(project['id'])
+        parts.append(f"{EMOJI_CAMERA} *Time-lapse Images:* {timelapse_count}\n")
+        
+        # Get latest AI analysis
+        analysis = db.get_latest_ai_analysis(project['id'])
+        if analysis:
+            parts.append(f"\n{EMOJI_ROBOT} *Latest AI Health Score:* {analysis.get('health_score', 'N/A')}/10\n")
+        
+        return ''.join(parts)
 
 
 # Singleton instance
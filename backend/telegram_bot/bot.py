@@ -10,21 +10,56 @@ Provides commands:
 """
 import logging
 import asyncio
-from typing import Optional
+import time
+from functools import partial
+from typing import Optional, Dict, Tuple
 from pathlib import Path
 
 try:
     from telegram import Update
+    from telegram.constants import ChatAction
     from telegram.ext import Application, CommandHandler, ContextTypes
     TELEGRAM_AVAILABLE = True
 except ImportError:
     TELEGRAM_AVAILABLE = False
     logging.warning("python-telegram-bot not available")
 
-from backend.config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, GPIO_PINS, get_device_display_name
+from backend.config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, DEVICE_NAMES, get_device_display_name
 
 logger = logging.getLogger(__name__)
 
+# Seconds a /status or /devices snapshot is shared between commands
+SNAPSHOT_TTL = 1.0
+
+# Seconds allowed for uploading a request body (camera photos on a slow uplink)
+BOT_WRITE_TIMEOUT = 20.0
+
+# Reply templates, filled with str.format_map
+_STATUS_TMPL = (
+    "📊 *Current Status*\n\n"
+    "{environment}"
+    "🔌 *Devices*\n"
+    "{devices}"
+)
+_ENVIRONMENT_TMPL = (
+    "🌡️ *Environment*\n"
+    "Temperature: {temperature:.1f}°C\n"
+    "Humidity: {humidity:.1f}%\n"
+    "Pressure: {pressure:.1f} hPa\n"
+    "Gas: {gas_resistance:.0f} Ω\n\n"
+)
+_NO_SENSOR_DATA = "⚠️ No sensor data available\n\n"
+_ALERTS_TMPL = (
+    "🔔 *Alert Settings*\n\n"
+    "Status: {enabled}\n\n"
+    "Temperature:\n"
+    "  Min: {temp_min}°C\n"
+    "  Max: {temp_max}°C\n\n"
+    "Humidity:\n"
+    "  Min: {humidity_min}%\n"
+    "  Max: {humidity_max}%\n"
+)
+
 class TelegramBot:
     """Telegram bot for grow tent automation."""
     
@@ -40,12 +75,16 @@ class TelegramBot:
         self.application: Optional[Application] = None
         self.running = False
         
-        if not TELEGRAM_AVAILABLE:
-            logger.warning("Telegram bot disabled - library not available")
-    
-    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /start command."""
-        await update.message.reply_text(
+        # Event loop the bot runs on, for sends from other threads
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # bot.send_message bound to the configured chat and parse mode
+        self._send = None
+        
+        # Device names and help text are fixed for the process lifetime
+        self._device_list_str = ", ".join(DEVICE_NAMES)
+        self._display = {d: get_device_display_name(d) for d in DEVICE_NAMES}
+        self._help_text = (
             "🌱 *Grow Tent Automation Bot*\n\n"
             "Available commands:\n"
             "/status - Current sensor readings and device states\n"
@@ -54,52 +93,72 @@ class TelegramBot:
             "/off <device> - Turn device off\n"
             "/alerts - View alert settings\n"
             "/photo - Get camera snapshot\n\n"
-            "Device names: " + ", ".join(GPIO_PINS.keys()),
-            parse_mode='Markdown'
+            "Device names: " + self._device_list_str
         )
+        
+        # Recent sensor/device snapshot shared by /status and /devices
+        self._snapshot_lock = asyncio.Lock()
+        self._snapshot_ts = 0.0
+        self._snapshot: Tuple[Optional[Dict[str, float]], Dict[str, bool]] = (None, {})
+        
+        if not TELEGRAM_AVAILABLE:
+            logger.warning("Telegram bot disabled - library not available")
+    
+    async def _get_snapshot(self) -> Tuple[Optional[Dict[str, float]], Dict[str, bool]]:
+        """Get sensor data and device states, shared for SNAPSHOT_TTL seconds.
+        
+        Concurrent commands wait on the lock and reuse the snapshot taken
+        by the first one instead of each reading the sensor.
+        
+        Returns:
+            Tuple of (sensor data or None, device states)
+        """
+        async with self._snapshot_lock:
+            if time.monotonic() - self._snapshot_ts < SNAPSHOT_TTL:
+                return self._snapshot
+            
+            sensor_data = await asyncio.to_thread(self.engine.get_sensor_data)
+            device_states = self.engine.get_device_states()
+            
+            self._snapshot = (sensor_data, device_states)
+            self._snapshot_ts = time.monotonic()
+            return self._snapshot
+    
+    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /start command."""
+        await update.message.reply_text(self._help_text, parse_mode='Markdown')
     
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /status command - show sensor readings and device states."""
         try:
-            # Get sensor data
-            sensor_data = self.engine.get_sensor_data()
-            
-            # Get device states
-            device_states = self.engine.get_device_states()
+            # Get sensor data and device states
+            sensor_data, device_states = await self._get_snapshot()
             
             # Format message
-            message = "📊 *Current Status*\n\n"
-            
-            if sensor_data:
-                message += "🌡️ *Environment*\n"
-                message += f"Temperature: {sensor_data['temperature']:.1f}°C\n"
-                message += f"Humidity: {sensor_data['humidity']:.1f}%\n"
-                message += f"Pressure: {sensor_data['pressure']:.1f} hPa\n"
-                message += f"Gas: {sensor_data['gas_resistance']:.0f} Ω\n\n"
-            else:
-                message += "⚠️ No sensor data available\n\n"
-            
-            message += "🔌 *Devices*\n"
-            for device, state in device_states.items():
-                status = "✅ ON" if state else "❌ OFF"
-                device_display = get_device_display_name(device)
-                message += f"{device_display}: {status}\n"
+            environment = (_ENVIRONMENT_TMPL.format_map(sensor_data)
+                           if sensor_data else _NO_SENSOR_DATA)
+            devices = "".join(
+                f"{self._display.get(device) or get_device_display_name(device)}: "
+                f"{'✅ ON' if state else '❌ OFF'}\n"
+                for device, state in device_states.items()
+            )
+            message = _STATUS_TMPL.format_map({'environment': environment, 'devices': devices})
             
             await update.message.reply_text(message, parse_mode='Markdown')
             
         except Exception as e:
-            logger.error(f"Error in status command: {e}")
+            logger.error("Error in status command: %s", e, exc_info=True)
             await update.message.reply_text(f"Error getting status: {e}")
     
     async def devices_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /devices command - list all devices."""
         try:
-            device_states = self.engine.get_device_states()
+            _, device_states = await self._get_snapshot()
             
             message = "🔌 *Device List*\n\n"
             for device, state in device_states.items():
                 status = "✅ ON" if state else "❌ OFF"
-                device_display = get_device_display_name(device)
+                device_display = self._display.get(device) or get_device_display_name(device)
                 message += f"• {device_display}: {status}\n"
             
             message += "\nUse /on <device> or /off <device> to control"
@@ -107,7 +166,7 @@ class TelegramBot:
             await update.message.reply_text(message, parse_mode='Markdown')
             
         except Exception as e:
-            logger.error(f"Error in devices command: {e}")
+            logger.error("Error in devices command: %s", e, exc_info=True)
             await update.message.reply_text(f"Error getting devices: {e}")
     
     async def on_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -116,26 +175,28 @@ class TelegramBot:
             if not context.args:
                 await update.message.reply_text(
                     "Usage: /on <device>\n"
-                    "Available devices: " + ", ".join(GPIO_PINS.keys())
+                    "Available devices: " + self._device_list_str
                 )
                 return
             
             device_name = context.args[0].lower()
             
-            if device_name not in GPIO_PINS:
+            if device_name not in self._display:
                 await update.message.reply_text(f"Unknown device: {device_name}")
                 return
             
-            success = self.engine.turn_device_on(device_name)
+            success = await asyncio.to_thread(self.engine.turn_device_on, device_name)
             
             if success:
-                device_display = get_device_display_name(device_name)
+                # Don't let a cached snapshot show the old state
+                self._snapshot_ts = 0.0
+                device_display = self._display[device_name]
                 await update.message.reply_text(f"✅ Turned ON {device_display}")
             else:
                 await update.message.reply_text(f"❌ Failed to turn on {device_name}")
             
         except Exception as e:
-            logger.error(f"Error in on command: {e}")
+            logger.error("Error in on command: %s", e, exc_info=True)
             await update.message.reply_text(f"Error: {e}")
     
     async def off_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -144,33 +205,35 @@ class TelegramBot:
             if not context.args:
                 await update.message.reply_text(
                     "Usage: /off <device>\n"
-                    "Available devices: " + ", ".join(GPIO_PINS.keys())
+                    "Available devices: " + self._device_list_str
                 )
                 return
             
             device_name = context.args[0].lower()
             
-            if device_name not in GPIO_PINS:
+            if device_name not in self._display:
                 await update.message.reply_text(f"Unknown device: {device_name}")
                 return
             
-            success = self.engine.turn_device_off(device_name)
+            success = await asyncio.to_thread(self.engine.turn_device_off, device_name)
             
             if success:
-                device_display = get_device_display_name(device_name)
+                # Don't let a cached snapshot show the old state
+                self._snapshot_ts = 0.0
+                device_display = self._display[device_name]
                 await update.message.reply_text(f"❌ Turned OFF {device_display}")
             else:
                 await update.message.reply_text(f"❌ Failed to turn off {device_name}")
             
         except Exception as e:
-            logger.error(f"Error in off command: {e}")
+            logger.error("Error in off command: %s", e, exc_info=True)
             await update.message.reply_text(f"Error: {e}")
     
     async def alerts_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /alerts command - show alert settings."""
         try:
             from backend.database import db
-            alert_settings = db.get_alert_settings()
+            alert_settings = await asyncio.to_thread(db.get_alert_settings)
             
             if not alert_settings:
                 await update.message.reply_text("No alert settings configured")
@@ -178,39 +241,42 @@ class TelegramBot:
             
             enabled = "✅ Enabled" if alert_settings.get('enabled') else "❌ Disabled"
             
-            message = f"🔔 *Alert Settings*\n\n"
-            message += f"Status: {enabled}\n\n"
-            message += f"Temperature:\n"
-            message += f"  Min: {alert_settings.get('temp_min', 'N/A')}°C\n"
-            message += f"  Max: {alert_settings.get('temp_max', 'N/A')}°C\n\n"
-            message += f"Humidity:\n"
-            message += f"  Min: {alert_settings.get('humidity_min', 'N/A')}%\n"
-            message += f"  Max: {alert_settings.get('humidity_max', 'N/A')}%\n"
+            message = _ALERTS_TMPL.format_map({
+                'enabled': enabled,
+                'temp_min': alert_settings.get('temp_min', 'N/A'),
+                'temp_max': alert_settings.get('temp_max', 'N/A'),
+                'humidity_min': alert_settings.get('humidity_min', 'N/A'),
+                'humidity_max': alert_settings.get('humidity_max', 'N/A')
+            })
             
             await update.message.reply_text(message, parse_mode='Markdown')
             
         except Exception as e:
-            logger.error(f"Error in alerts command: {e}")
+            logger.error("Error in alerts command: %s", e, exc_info=True)
             await update.message.reply_text(f"Error: {e}")
     
     async def photo_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /photo command - capture and send photo."""
         try:
-            await update.message.reply_text("📸 Capturing photo...")
+            # A chat action shows "sending photo..." without a separate message
+            await update.message.reply_chat_action(ChatAction.UPLOAD_PHOTO)
             
-            photo_path = self.engine.capture_photo()
+            photo_path = await asyncio.to_thread(self.engine.capture_photo)
             
             if photo_path and Path(photo_path).exists():
-                with open(photo_path, 'rb') as photo:
-                    await update.message.reply_photo(
-                        photo=photo,
-                        caption=f"📷 Grow tent snapshot"
-                    )
+                # PTB reads file inputs into the request body synchronously;
+                # do that read in a worker thread instead of on the loop
+                photo = await asyncio.to_thread(Path(photo_path).read_bytes)
+                await update.message.reply_photo(
+                    photo=photo,
+                    filename=Path(photo_path).name,
+                    caption=f"📷 Grow tent snapshot"
+                )
             else:
                 await update.message.reply_text("❌ Failed to capture photo")
             
         except Exception as e:
-            logger.error(f"Error in photo command: {e}")
+            logger.error("Error in photo command: %s", e, exc_info=True)
             await update.message.reply_text(f"Error: {e}")
     
     async def send_message(self, message: str):
@@ -220,14 +286,34 @@ class TelegramBot:
             message: Message to send
         """
         try:
-            if self.application and self.running:
-                await self.application.bot.send_message(
-                    chat_id=self.chat_id,
-                    text=message,
-                    parse_mode='Markdown'
-                )
+            if self._send and self.running:
+                await self._send(text=message)
+        except Exception as e:
+            logger.error("Error sending Telegram message: %s", e, exc_info=True)
+    
+    def send_message_threadsafe(self, message: str, timeout: float = 30) -> bool:
+        """Send a message from a thread other than the bot's event loop.
+        
+        The send runs on the bot's loop, reusing its HTTP connection pool,
+        and this call waits for it.
+        
+        Args:
+            message: Message to send
+            timeout: Seconds to wait for the send
+            
+        Returns:
+            True if the send was completed
+        """
+        if not self._loop or not self.running:
+            return False
+        
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.send_message(message), self._loop)
+            future.result(timeout=timeout)
+            return True
         except Exception as e:
-            logger.error(f"Error sending Telegram message: {e}")
+            logger.error("Error sending Telegram message: %s", e, exc_info=True)
+            return False
     
     async def send_alert(self, alert_message: str):
         """Send an alert message.
@@ -238,46 +324,76 @@ class TelegramBot:
         message = f"⚠️ *ALERT*\n\n{alert_message}"
         await self.send_message(message)
     
-    def start(self):
-        """Start the Telegram bot."""
+    def _build_application(self):
+        """Create the Application and register command handlers."""
+        # Handle updates concurrently so a slow /photo capture doesn't queue
+        # /on and /off behind it; blocking work already runs in threads
+        application = (
+            Application.builder()
+            .token(self.bot_token)
+            .concurrent_updates(True)
+            .write_timeout(BOT_WRITE_TIMEOUT)
+            .build()
+        )
+        self._send = partial(
+            application.bot.send_message, chat_id=self.chat_id, parse_mode='Markdown'
+        )
+        
+        # Add command handlers
+        application.add_handler(CommandHandler("start", self.start_command))
+        application.add_handler(CommandHandler("status", self.status_command))
+        application.add_handler(CommandHandler("devices", self.devices_command))
+        application.add_handler(CommandHandler("on", self.on_command))
+        application.add_handler(CommandHandler("off", self.off_command))
+        application.add_handler(CommandHandler("alerts", self.alerts_command))
+        application.add_handler(CommandHandler("photo", self.photo_command))
+        
+        return application
+    
+    def _can_start(self) -> bool:
+        """Check that the library and a token are available."""
         if not TELEGRAM_AVAILABLE:
             logger.warning("Cannot start Telegram bot - library not available")
-            return
+            return False
         
         if not self.bot_token:
             logger.warning("Cannot start Telegram bot - no token configured")
+            return False
+        
+        return True
+    
+    async def start_async(self):
+        """Start polling on the caller's event loop.
+        
+        Returns once polling is running; updates are then handled by tasks
+        on the same loop, so no dedicated thread is needed.
+        """
+        if not self._can_start():
             return
         
         try:
-            # Create application
-            self.application = Application.builder().token(self.bot_token).build()
-            
-            # Add command handlers
-            self.application.add_handler(CommandHandler("start", self.start_command))
-            self.application.add_handler(CommandHandler("status", self.status_command))
-            self.application.add_handler(CommandHandler("devices", self.devices_command))
-            self.application.add_handler(CommandHandler("on", self.on_command))
-            self.application.add_handler(CommandHandler("off", self.off_command))
-            self.application.add_handler(CommandHandler("alerts", self.alerts_command))
-            self.application.add_handler(CommandHandler("photo", self.photo_command))
-            
-            # Start bot in separate thread
+            self.application = self._build_application()
+            await self.application.initialize()
+            await self.application.start()
+            await self.application.updater.start_polling()
+            self._loop = asyncio.get_running_loop()
             self.running = True
-            
             logger.info("Telegram bot started")
-            
-            # Run bot
-            self.application.run_polling()
-            
         except Exception as e:
-            logger.error(f"Error starting Telegram bot: {e}")
+            logger.error("Error starting Telegram bot: %s", e, exc_info=True)
     
-    def stop(self):
-        """Stop the Telegram bot."""
+    async def stop_async(self):
+        """Stop polling and shut the application down."""
         self.running = False
-        if self.application:
-            try:
-                logger.info("Stopping Telegram bot...")
-                # The polling will stop when the application is shut down
-            except Exception as e:
-                logger.error(f"Error stopping Telegram bot: {e}")
+        if not self.application:
+            return
+        
+        try:
+            logger.info("Stopping Telegram bot...")
+            if self.application.updater and self.application.updater.running:
+                await self.application.updater.stop()
+            if self.application.running:
+                await self.application.stop()
+            await self.application.shutdown()
+        except Exception as e:
+            logger.error("Error stopping Telegram bot: %s", e, exc_info=True)
@@ -0,0 +1,78 @@
+"""Filesystem helpers shared by the API and background tasks."""
+import os
+from typing import Optional, Union
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+
+# Prefix of alias files (latest_snapshot.jpg) that point at another photo
+LATEST_ALIAS_PREFIX = "latest_"
+
+
+def latest_photo(photos_dir: Union[str, os.PathLike]) -> Optional[str]:
+    """Find the most recently modified JPEG in a directory in one pass.
+    
+    Uses os.scandir so each entry's mtime comes from the directory
+    listing instead of building and sorting a Path per file. Aliases
+    such as latest_snapshot.jpg (a hard link to the newest capture) are
+    skipped, so callers always get the real, immutable photo path.
+    
+    Args:
+        photos_dir: Directory to scan
+        
+    Returns:
+        Path of the newest .jpg, or None if there is none
+    """
+    latest = None
+    latest_mtime = -1.0
+    with os.scandir(photos_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(LATEST_ALIAS_PREFIX):
+                continue
+            if entry.name.endswith('.jpg') and entry.is_file():
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime, latest = mtime, entry.path
+    return latest
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether a request's If-None-Match header names an ETag.
+    
+    Args:
+        request: Incoming request
+        etag: Quoted entity tag of the current representation
+        
+    Returns:
+        True if the client's cached copy is current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags or "*" in tags
+
+
+def conditional_file_response(request: Request, path: Union[str, os.PathLike],
+                              **kwargs) -> Response:
+    """Serve a file, answering 304 Not Modified when the client has it.
+    
+    FileResponse sets ETag and Last-Modified from the file's stat but,
+    unlike StaticFiles, never checks If-None-Match itself.
+    
+    Args:
+        request: Incoming request
+        path: File to serve
+        **kwargs: Passed through to FileResponse (media_type, filename, ...)
+        
+    Returns:
+        FileResponse, or an empty 304 response carrying the same ETag
+    """
+    response = FileResponse(path, stat_result=os.stat(path), **kwargs)
+    etag = response.headers.get("etag")
+    if etag and etag_matches(request, etag):
+        return Response(status_code=304, headers={
+            "ETag": etag,
+            "Last-Modified": response.headers["last-modified"],
+        })
+    return response
@@ -1,18 +1,43 @@
 """Logging configuration for grow tent automation system."""
+import atexit
 import logging
 import sys
-from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
+import time
+from queue import SimpleQueue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from typing import Optional
 
 from backend.config import (
     LOGS_DIR, LOG_LEVEL, LOG_MAX_SIZE, LOG_BACKUP_COUNT,
     get_setting
 )
 
+# Background thread writing the log files; replaced on each setup_logging()
+_file_listener: Optional[QueueListener] = None
+
+
+def _stop_file_listener():
+    """Flush queued records to the log files and stop the writer thread."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def setup_logging():
-    """Configure logging for the application with rotation."""
+    """Configure logging for the application with rotation.
+    
+    File handlers run behind a QueueHandler so callers (the event loop,
+    the automation thread) only enqueue records; a QueueListener thread
+    does the encoding, writes and rotation.
+    """
+    global _file_listener
+    
     # Get logging settings
     level_str = get_setting('logging.level', LOG_LEVEL)
     max_size = get_setting('logging.max_file_size', LOG_MAX_SIZE)
@@ -42,6 +67,7 @@ def setup_logging():
     
     # Remove existing handlers
     root_logger.handlers = []
+    _stop_file_listener()
     
     # Console handler
     if log_to_console:
@@ -53,7 +79,7 @@ def setup_logging():
     # File handler with rotation
     if log_to_file:
         LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        log_file = LOGS_DIR / f"grow_tent_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = LOGS_DIR / f"grow_tent_{time.strftime('%Y%m%d')}.log"
         
         file_handler = RotatingFileHandler(
             log_file,
@@ -63,7 +89,6 @@ def setup_logging():
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
         
         # Also create an error-only log file
         error_log_file = LOGS_DIR / "errors.log"
@@ -75,7 +100,16 @@ def setup_logging():
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
-        root_logger.addHandler(error_handler)
+        
+        # Hand records to a writer thread instead of writing in the caller
+        log_queue = SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(level)
+        root_logger.addHandler(queue_handler)
+        _file_listener = QueueListener(
+            log_queue, file_handler, error_handler, respect_handler_level=True
+        )
+        _file_listener.start()
     
     # Set levels for noisy libraries
     logging.getLogger('urllib3').setLevel(logging.WARNING)
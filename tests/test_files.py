@@ -0,0 +1,28 @@
+"""Tests for backend.utils.files."""
+import os
+
+import pytest
+
+pytest.importorskip("starlette")
+
+from backend.utils.files import latest_photo
+
+
+def test_latest_photo_skips_snapshot_alias(tmp_path):
+    capture = tmp_path / "capture_20260101_120000.jpg"
+    capture.write_bytes(b"jpeg")
+    older = tmp_path / "capture_20260101_110000.jpg"
+    older.write_bytes(b"jpeg")
+    os.utime(older, (1, 1))
+    
+    # The live-feed alias is a hard link to the newest capture, so it
+    # shares its mtime
+    os.link(capture, tmp_path / "latest_snapshot.jpg")
+    
+    assert latest_photo(tmp_path) == str(capture)
+
+
+def test_latest_photo_only_alias(tmp_path):
+    (tmp_path / "latest_snapshot.jpg").write_bytes(b"jpeg")
+    
+    assert latest_photo(tmp_path) is None